@@ -183,6 +183,7 @@ export interface CloudOpsRequest {
   request_type: 'scaling' | 'parameter_change' | 'maintenance'
   changes: Record<string, any>
   requested_by?: string
+  include_content?: boolean
 }
 
 export interface CloudOpsResponse {
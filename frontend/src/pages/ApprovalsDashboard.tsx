@@ -22,13 +22,14 @@ interface ApprovalRequest {
   request_id: string
   operation_type: string
   instance_id: string
-  parameters: Record<string, any>
+  // Only returned by get_request; list operations omit them
+  parameters?: Record<string, any>
   requested_by: string
   requested_at: string
   risk_level: 'low' | 'medium' | 'high'
   environment: string
   justification: string
-  estimated_cost?: number
+  estimated_cost?: number | string | null
   estimated_duration?: string
   status: 'pending' | 'approved' | 'rejected' | 'expired' | 'executed' | 'cancelled'
   approvals_required: number
@@ -40,7 +41,7 @@ interface ApprovalRequest {
   rejection_reason?: string
   expires_at: string
   executed_at?: string
-  comments: Array<{
+  comments?: Array<{
     user: string
     timestamp: string
     action: string
@@ -78,6 +79,19 @@ export default function ApprovalsDashboard() {
     refetchInterval: 30000, // Refresh every 30 seconds
   })
 
+  // Fetch full details for the selected request (list responses omit parameters and comments)
+  const { data: selectedRequestDetails } = useQuery({
+    queryKey: ['approval-request', selectedRequest?.request_id],
+    queryFn: async () => {
+      const response = await apiClient.post('/api/approvals', {
+        operation: 'get_request',
+        request_id: selectedRequest?.request_id
+      })
+      return response.data as ApprovalRequest
+    },
+    enabled: !!selectedRequest && !showApproveModal && !showRejectModal,
+  })
+
   // Fetch user's requests
   const { data: myRequests, isLoading: myRequestsLoading } = useQuery({
     queryKey: ['my-requests'],
@@ -286,12 +300,12 @@ export default function ApprovalsDashboard() {
           </div>
         </div>
 
-        {request.estimated_cost && (
+        {request.estimated_cost != null && (
           <div className="flex items-start gap-2">
             <DollarSign className="w-4 h-4 text-gray-400 mt-0.5" />
             <div className="flex-1">
               <p className="text-xs text-gray-500">Estimated Cost</p>
-              <p className="text-sm font-medium">${request.estimated_cost.toFixed(2)}/month</p>
+              <p className="text-sm font-medium">${Number(request.estimated_cost).toFixed(2)}/month</p>
             </div>
           </div>
         )}
@@ -592,15 +606,17 @@ export default function ApprovalsDashboard() {
               <div>
                 <p className="text-sm text-gray-600">Parameters</p>
                 <pre className="bg-gray-50 p-3 rounded text-xs overflow-x-auto">
-                  {JSON.stringify(selectedRequest.parameters, null, 2)}
+                  {selectedRequestDetails
+                    ? JSON.stringify(selectedRequestDetails.parameters, null, 2)
+                    : 'Loading...'}
                 </pre>
               </div>
               
-              {selectedRequest.comments.length > 0 && (
+              {selectedRequestDetails?.comments && selectedRequestDetails.comments.length > 0 && (
                 <div>
                   <p className="text-sm text-gray-600 mb-2">Comments</p>
                   <div className="space-y-2">
-                    {selectedRequest.comments.map((comment, idx) => (
+                    {selectedRequestDetails.comments.map((comment, idx) => (
                       <div key={idx} className="bg-gray-50 p-3 rounded">
                         <p className="text-xs text-gray-600">
                           {comment.user} - {formatDate(comment.timestamp)}
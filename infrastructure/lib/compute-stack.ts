@@ -19,6 +19,8 @@ import * as iam from 'aws-cdk-lib/aws-iam';
 import * as dynamodb from 'aws-cdk-lib/aws-dynamodb';
 import * as s3 from 'aws-cdk-lib/aws-s3';
 import * as kms from 'aws-cdk-lib/aws-kms';
+import * as sns from 'aws-cdk-lib/aws-sns';
+import * as subscriptions from 'aws-cdk-lib/aws-sns-subscriptions';
 import { Construct } from 'constructs';
 
 export interface ComputeStackProps extends cdk.StackProps {
@@ -49,6 +51,9 @@ export class ComputeStack extends cdk.Stack {
   public readonly cloudOpsGeneratorFunction: lambda.Function;
   public readonly monitoringFunction: lambda.Function;
   public readonly approvalWorkflowFunction: lambda.Function;
+  public readonly approvalEventsTopic: sns.Topic;
+  public readonly approvalAuditWriterFunction: lambda.Function;
+  public readonly approvalNotifierFunction: lambda.Function;
   public readonly accountDiscoveryFunction: lambda.Function;
   public readonly errorResolutionFunction: lambda.Function;
   public readonly monitoringDashboardFunction: lambda.Function;
@@ -269,6 +274,16 @@ export class ComputeStack extends cdk.Stack {
       description: 'Fetches CloudWatch metrics for RDS instances',
     });
 
+    // ========================================
+    // SNS Topic: Approval Events
+    // ========================================
+    // Purpose: Fan out approval events so audit writes and notifications
+    // run asynchronously instead of on the approval request path
+    this.approvalEventsTopic = new sns.Topic(this, 'ApprovalEventsTopic', {
+      topicName: 'rds-approval-events',
+      displayName: 'RDS Approval Workflow Events',
+    });
+
     // ========================================
     // Lambda Function: Approval Workflow Service
     // ========================================
@@ -283,13 +298,66 @@ export class ComputeStack extends cdk.Stack {
       environment: {
         APPROVALS_TABLE: approvalsTable.tableName,
         AUDIT_LOG_TABLE: auditLogTable.tableName,
-        SNS_TOPIC_ARN: snsTopicArn,
+        APPROVAL_EVENTS_TOPIC_ARN: this.approvalEventsTopic.topicArn,
         CLOUDWATCH_NAMESPACE: 'RDSDashboard',
         LOG_LEVEL: 'INFO'
       },
       description: 'Manages approval workflow for high-risk RDS operations',
     });
 
+    this.approvalEventsTopic.grantPublish(this.approvalWorkflowFunction);
+
+    // ========================================
+    // Lambda Functions: Approval Event Subscribers
+    // ========================================
+    this.approvalAuditWriterFunction = new lambda.Function(this, 'ApprovalAuditWriterFunction', {
+      functionName: 'rds-approval-audit-writer',
+      runtime: lambda.Runtime.PYTHON_3_11,
+      handler: 'event_subscribers.audit_writer_handler',
+      code: lambda.Code.fromAsset('../lambda/approval-workflow'),
+      role: lambdaExecutionRole,
+      timeout: cdk.Duration.seconds(30),
+      memorySize: 256,
+      environment: {
+        AUDIT_LOG_TABLE: auditLogTable.tableName,
+        LOG_LEVEL: 'INFO'
+      },
+      description: 'Writes approval workflow events to the audit log',
+    });
+
+    this.approvalNotifierFunction = new lambda.Function(this, 'ApprovalNotifierFunction', {
+      functionName: 'rds-approval-notifier',
+      runtime: lambda.Runtime.PYTHON_3_11,
+      handler: 'event_subscribers.notification_handler',
+      code: lambda.Code.fromAsset('../lambda/approval-workflow'),
+      role: lambdaExecutionRole,
+      timeout: cdk.Duration.seconds(30),
+      memorySize: 256,
+      environment: {
+        SNS_TOPIC_ARN: snsTopicArn,
+        LOG_LEVEL: 'INFO'
+      },
+      description: 'Sends approval workflow email notifications',
+    });
+
+    this.approvalEventsTopic.addSubscription(
+      new subscriptions.LambdaSubscription(this.approvalAuditWriterFunction, {
+        filterPolicy: {
+          event_type: sns.SubscriptionFilter.stringFilter({ matchPrefixes: ['APPROVAL_'] }),
+        },
+      })
+    );
+
+    this.approvalEventsTopic.addSubscription(
+      new subscriptions.LambdaSubscription(this.approvalNotifierFunction, {
+        filterPolicy: {
+          event_type: sns.SubscriptionFilter.stringFilter({
+            allowlist: ['APPROVAL_REQUEST_CREATED', 'APPROVAL_GRANTED', 'APPROVAL_REJECTED'],
+          }),
+        },
+      })
+    );
+
     // ========================================
     // Lambda Function: Account Discovery (Onboarding)
     // ========================================
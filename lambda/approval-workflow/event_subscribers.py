@@ -0,0 +1,149 @@
+"""
+RDS Operations Approval Event Subscribers
+
+Asynchronous consumers of the approval events published by the approval
+workflow service. Audit writes and email notifications run here so they
+stay off the synchronous request path.
+
+- audit_writer_handler: persists every APPROVAL_* event to the audit table
+- notification_handler: sends approval emails for created/granted/rejected events
+
+Requirements: REQ-APPROVAL (Operations Approval Workflow), REQ-5.1 (structured logging)
+"""
+
+import json
+import os
+from decimal import Decimal
+from typing import Dict, Any, List
+
+from shared.logger import StructuredLogger
+from shared.aws_clients import AWSClients
+
+logger = StructuredLogger("approval-events")
+
+# AWS clients reused across warm invocations
+_audit_table = None
+_sns_client = None
+
+
+def _get_audit_table():
+    """Get the audit table handle, creating it once per container."""
+    global _audit_table
+    if _audit_table is None:
+        _audit_table = AWSClients.get_dynamodb_resource().Table(
+            os.environ.get('AUDIT_LOG_TABLE', 'audit-log-prod')
+        )
+    return _audit_table
+
+
+def _get_sns_client():
+    """Get the SNS client, creating it once per container."""
+    global _sns_client
+    if _sns_client is None:
+        _sns_client = AWSClients.get_sns_client()
+    return _sns_client
+
+
+def _parse_events(event: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract approval events from an SNS-triggered Lambda event."""
+    return [
+        json.loads(record['Sns']['Message'], parse_float=Decimal)
+        for record in event.get('Records', [])
+    ]
+
+
+def audit_writer_handler(event, context):
+    """Write approval events to the audit table."""
+    audit_table = _get_audit_table()
+    
+    approval_events = _parse_events(event)
+    for approval_event in approval_events:
+        # The request snapshot is only carried for notifications
+        approval_event.pop('request', None)
+        audit_table.put_item(Item=approval_event)
+    
+    logger.info(f"Wrote {len(approval_events)} approval audit events")
+    return {'written': len(approval_events)}
+
+
+def notification_handler(event, context):
+    """Send approval notifications to the dashboard SNS topic."""
+    sns_topic_arn = os.environ.get('SNS_TOPIC_ARN')
+    if not sns_topic_arn:
+        return {'sent': 0}
+    
+    sns = _get_sns_client()
+    sent = 0
+    
+    for approval_event in _parse_events(event):
+        notification = _build_notification(approval_event)
+        if not notification:
+            continue
+        
+        subject, message = notification
+        try:
+            sns.publish(TopicArn=sns_topic_arn, Subject=subject, Message=message)
+            sent += 1
+        except Exception as e:
+            logger.error(f"Error sending {approval_event['event_type']} notification: {str(e)}")
+    
+    return {'sent': sent}
+
+
+def _build_notification(approval_event: Dict[str, Any]):
+    """Return (subject, message) for an approval event, or None if nobody needs notifying."""
+    event_type = approval_event['event_type']
+    request = approval_event['request']
+    
+    if event_type == 'APPROVAL_REQUEST_CREATED' and request['status'] == 'pending':
+        return (
+            f"RDS Operation Approval Required: {request['operation_type']}",
+            f"""
+New RDS Operation Approval Request
+
+Request ID: {request['request_id']}
+Operation: {request['operation_type']}
+Instance: {request['instance_id']}
+Environment: {request['environment']}
+Risk Level: {request['risk_level']}
+Requested By: {request['requested_by']}
+Justification: {request['justification']}
+Approvals Required: {request['approvals_required']}
+Expires: {request['expires_at']}
+
+Please review and approve/reject this request in the RDS Operations Dashboard.
+            """
+        )
+    
+    if event_type == 'APPROVAL_GRANTED' and request['status'] == 'approved':
+        return (
+            f"RDS Operation Approved: {request['operation_type']}",
+            f"""
+RDS Operation Approved
+
+Request ID: {request['request_id']}
+Operation: {request['operation_type']}
+Instance: {request['instance_id']}
+Requested By: {request['requested_by']}
+Approved By: {', '.join(request['approved_by'])}
+
+The operation can now be executed.
+            """
+        )
+    
+    if event_type == 'APPROVAL_REJECTED':
+        return (
+            f"RDS Operation Rejected: {request['operation_type']}",
+            f"""
+RDS Operation Rejected
+
+Request ID: {request['request_id']}
+Operation: {request['operation_type']}
+Instance: {request['instance_id']}
+Requested By: {request['requested_by']}
+Rejected By: {approval_event['user']}
+Reason: {approval_event['details']['reason']}
+            """
+        )
+    
+    return None
@@ -23,25 +23,75 @@ Governance Metadata:
 
 import json
 import os
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from decimal import Decimal
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, NamedTuple
+from decimal import Context, Decimal
 
-import boto3
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
+# orjson is optional; fall back to the stdlib json module when not packaged
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Shared imports
-import sys
-sys.path.append('/opt/python')
 from shared.logger import StructuredLogger
 from shared.aws_clients import AWSClients
-from shared.config import Config
 from shared.cors_helper import get_cors_headers, is_preflight_request, handle_preflight
+from shared.correlation_middleware import with_correlation_id
+from shared.retry import RetryExhausted
 
 logger = StructuredLogger("approval-workflow")
 
 
+# DynamoDB condition building blocks, created once at import; only the
+# per-call values are bound inside the query methods
+_STATUS = Attr('status')
+_EXPIRES_AT = Attr('expires_at')
+_REQUESTED_BY = Attr('requested_by')
+_APPROVED_BY = Attr('approved_by')
+_REQUESTED_BY_KEY = Key('requested_by')
+_PENDING_STATUS_KEY = Key('status').eq('pending')
+
+# Converts estimated costs straight from float; default precision stays
+# within DynamoDB's 38 significant digits
+_COST_CONTEXT = Context()
+
+
+class ApprovalRequirement(NamedTuple):
+    """Approval policy applied to a risk level."""
+    approvals_required: int
+    auto_approve: bool
+
+
+def _loads(body: str) -> Any:
+    """Parse a JSON request body."""
+    if orjson:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _dumps(result: Any) -> str:
+    """Serialize a response body; Decimal and other non-JSON types become strings."""
+    if orjson:
+        return orjson.dumps(result, default=str).decode()
+    return json.dumps(result, default=str)
+
+
+def _event_json_default(value: Any) -> Any:
+    """JSON default for event messages; Decimals stay numbers so subscribers store them as N."""
+    if isinstance(value, Decimal):
+        if value.is_finite() and value == value.to_integral_value():
+            return int(value)
+        return float(value)
+    return str(value)
+
+
 class ApprovalWorkflowService:
     """Manage approval workflow for RDS operations."""
     
@@ -58,21 +108,47 @@ class ApprovalWorkflowService:
     RISK_MEDIUM = 'medium'
     RISK_HIGH = 'high'
     
-    # Approval requirements by risk level
-    APPROVAL_REQUIREMENTS = {
-        RISK_LOW: {'approvals_required': 0, 'auto_approve': True},
-        RISK_MEDIUM: {'approvals_required': 1, 'auto_approve': False},
-        RISK_HIGH: {'approvals_required': 2, 'auto_approve': False}
-    }
+    # Approval requirements by risk level (read-only, shared across warm invocations)
+    APPROVAL_REQUIREMENTS = MappingProxyType({
+        RISK_LOW: ApprovalRequirement(approvals_required=0, auto_approve=True),
+        RISK_MEDIUM: ApprovalRequirement(approvals_required=1, auto_approve=False),
+        RISK_HIGH: ApprovalRequirement(approvals_required=2, auto_approve=False)
+    })
     
     # Expiration time (hours)
     EXPIRATION_HOURS = 72  # 3 days
     
+    # Keys accepted in each create_auto_approved_batch entry
+    BATCH_REQUIRED_FIELDS = frozenset({
+        'operation_type', 'instance_id', 'parameters', 'requested_by',
+        'risk_level', 'environment', 'justification'
+    })
+    BATCH_OPTIONAL_FIELDS = frozenset({'estimated_cost', 'estimated_duration'})
+    
+    # Maximum write requests per BatchWriteItem call
+    BATCH_WRITE_SIZE = 25
+    
+    # Backoff for resubmitting BatchWriteItem UnprocessedItems
+    BATCH_WRITE_MAX_RETRIES = 8
+    BATCH_WRITE_BASE_DELAY = 0.05  # seconds, doubled per retry
+    
+    # Global secondary indexes on the approvals table (see data-stack.ts)
+    STATUS_INDEX = 'status-index'
+    REQUESTER_INDEX = 'requester-index'
+    
+    # Attributes returned by list queries; parameters, comments and
+    # execution_result are only loaded for the single-request detail view
+    LIST_PROJECTION = (
+        'request_id, operation_type, instance_id, requested_by, requested_at, '
+        'risk_level, environment, justification, estimated_cost, estimated_duration, '
+        '#status, approvals_required, approvals_received, approved_by, approved_at, '
+        'rejected_by, rejected_at, rejection_reason, expires_at, executed_at'
+    )
+    
     def __init__(self):
         """Initialize approval workflow service."""
         self.dynamodb = AWSClients.get_dynamodb_resource()
-        self.sns = boto3.client('sns')
-        self.config = Config.load()
+        self.sns = AWSClients.get_sns_client()
         
         # DynamoDB tables
         self.approvals_table_name = os.environ.get('APPROVALS_TABLE', 'rds-approvals-prod')
@@ -80,8 +156,15 @@ class ApprovalWorkflowService:
         self.audit_table_name = os.environ.get('AUDIT_LOG_TABLE', 'audit-log-prod')
         self.audit_table = self.dynamodb.Table(self.audit_table_name)
         
-        # SNS topic for notifications
-        self.sns_topic_arn = os.environ.get('SNS_TOPIC_ARN')
+        # SNS topic for approval events (fanned out to audit and notification subscribers)
+        self.events_topic_arn = os.environ.get('APPROVAL_EVENTS_TOPIC_ARN')
+        
+        # Approval requests read or written during the current invocation
+        self._request_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+    
+    def clear_request_cache(self):
+        """Forget requests cached by a previous invocation."""
+        self._request_cache.clear()
     
     def create_approval_request(
         self,
@@ -113,57 +196,40 @@ class ApprovalWorkflowService:
             dict: Created approval request
         """
         try:
-            # Generate request ID
-            request_id = str(uuid.uuid4())
-            
-            # Get approval requirements
-            requirements = self.APPROVAL_REQUIREMENTS.get(
-                risk_level,
-                self.APPROVAL_REQUIREMENTS[self.RISK_MEDIUM]
+            approval_request = self._build_approval_request(
+                datetime.utcnow(),
+                operation_type=operation_type,
+                instance_id=instance_id,
+                parameters=parameters,
+                requested_by=requested_by,
+                risk_level=risk_level,
+                environment=environment,
+                justification=justification,
+                estimated_cost=estimated_cost,
+                estimated_duration=estimated_duration
             )
-            
-            # Calculate expiration
-            expiration_time = datetime.utcnow() + timedelta(hours=self.EXPIRATION_HOURS)
-            
-            # Determine initial status
-            if requirements['auto_approve']:
-                status = self.STATUS_APPROVED
-                approved_by = ['system']
-                approved_at = datetime.utcnow().isoformat()
+            request_id = approval_request['request_id']
+            status = approval_request['status']
+            
+            if status == self.STATUS_APPROVED:
+                # Auto-approved requests need no notification, so skip the
+                # event fan-out and write the audit entry in the same round-trip
+                audit_entry = self._build_audit_entry(
+                    'APPROVAL_REQUEST_CREATED',
+                    requested_by,
+                    request_id,
+                    approval_request,
+                    approval_request['requested_at']
+                )
+                self.dynamodb.meta.client.transact_write_items(
+                    TransactItems=[
+                        {'Put': {'TableName': self.approvals_table_name, 'Item': approval_request}},
+                        {'Put': {'TableName': self.audit_table_name, 'Item': audit_entry}}
+                    ]
+                )
             else:
-                status = self.STATUS_PENDING
-                approved_by = []
-                approved_at = None
-            
-            # Create approval request
-            approval_request = {
-                'request_id': request_id,
-                'operation_type': operation_type,
-                'instance_id': instance_id,
-                'parameters': parameters,
-                'requested_by': requested_by,
-                'requested_at': datetime.utcnow().isoformat(),
-                'risk_level': risk_level,
-                'environment': environment,
-                'justification': justification,
-                'estimated_cost': Decimal(str(estimated_cost)) if estimated_cost else None,
-                'estimated_duration': estimated_duration,
-                'status': status,
-                'approvals_required': requirements['approvals_required'],
-                'approvals_received': len(approved_by),
-                'approved_by': approved_by,
-                'approved_at': approved_at,
-                'rejected_by': None,
-                'rejected_at': None,
-                'rejection_reason': None,
-                'expires_at': expiration_time.isoformat(),
-                'executed_at': None,
-                'execution_result': None,
-                'comments': []
-            }
-            
-            # Save to DynamoDB
-            self.approvals_table.put_item(Item=approval_request)
+                # Save to DynamoDB
+                self.approvals_table.put_item(Item=approval_request)
             
             logger.info(f"Created approval request {request_id}", extra={
                 'request_id': request_id,
@@ -173,17 +239,16 @@ class ApprovalWorkflowService:
                 'status': status
             })
             
-            # Send notification if approval required
-            if not requirements['auto_approve']:
-                self._send_approval_notification(approval_request)
-            
-            # Log to audit table
-            self._log_audit_event(
-                'APPROVAL_REQUEST_CREATED',
-                requested_by,
-                request_id,
-                approval_request
-            )
+            if status != self.STATUS_APPROVED:
+                # Audit and notify asynchronously
+                self._publish_event(
+                    'APPROVAL_REQUEST_CREATED',
+                    requested_by,
+                    request_id,
+                    approval_request,
+                    approval_request,
+                    timestamp=approval_request['requested_at']
+                )
             
             return approval_request
             
@@ -191,6 +256,149 @@ class ApprovalWorkflowService:
             logger.error(f"Error creating approval request: {str(e)}")
             raise
     
+    def create_auto_approved_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create a batch of auto-approved (low risk) requests.
+        
+        Requests and their audit entries are written with BatchWriteItem
+        instead of one transaction per request.
+        
+        Args:
+            requests: create_approval_request keyword arguments, one dict per request
+            
+        Returns:
+            list: Created approval requests
+        
+        Raises:
+            ValueError: If an entry has missing or unknown keys, or needs manual approval
+        """
+        try:
+            self._validate_batch_entries(requests)
+            
+            now = datetime.utcnow()
+            approval_requests = [
+                self._build_approval_request(now, **request) for request in requests
+            ]
+            
+            write_requests = []
+            for approval_request in approval_requests:
+                if approval_request['status'] != self.STATUS_APPROVED:
+                    raise ValueError(
+                        f"Risk level {approval_request['risk_level']} requires manual approval"
+                    )
+                
+                audit_entry = self._build_audit_entry(
+                    'APPROVAL_REQUEST_CREATED',
+                    approval_request['requested_by'],
+                    approval_request['request_id'],
+                    approval_request,
+                    approval_request['requested_at']
+                )
+                write_requests.append(
+                    (self.approvals_table_name, {'PutRequest': {'Item': approval_request}})
+                )
+                write_requests.append(
+                    (self.audit_table_name, {'PutRequest': {'Item': audit_entry}})
+                )
+            
+            self._batch_write(write_requests)
+            
+            logger.info(f"Created {len(approval_requests)} auto-approved requests")
+            
+            return approval_requests
+            
+        except Exception as e:
+            logger.error(f"Error creating auto-approved batch: {str(e)}")
+            raise
+    
+    def _validate_batch_entries(self, requests: List[Dict[str, Any]]):
+        """Raise a ValueError naming the first batch entry with missing or unknown keys."""
+        if not isinstance(requests, list):
+            raise ValueError("requests must be a list of request objects")
+        
+        for index, request in enumerate(requests):
+            if not isinstance(request, dict):
+                raise ValueError(f"requests[{index}] must be an object")
+            
+            missing = self.BATCH_REQUIRED_FIELDS - request.keys()
+            if missing:
+                raise ValueError(
+                    f"requests[{index}] is missing required fields: {', '.join(sorted(missing))}"
+                )
+            
+            unknown = request.keys() - self.BATCH_REQUIRED_FIELDS - self.BATCH_OPTIONAL_FIELDS
+            if unknown:
+                raise ValueError(
+                    f"requests[{index}] has unknown fields: {', '.join(sorted(unknown))}"
+                )
+    
+    def _build_approval_request(
+        self,
+        now: datetime,
+        operation_type: str,
+        instance_id: str,
+        parameters: Dict[str, Any],
+        requested_by: str,
+        risk_level: str,
+        environment: str,
+        justification: str,
+        estimated_cost: Optional[float] = None,
+        estimated_duration: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a new approval request item; all timestamps derive from now."""
+        now_iso = now.isoformat()
+        
+        # Get approval requirements
+        requirements = self.APPROVAL_REQUIREMENTS.get(
+            risk_level,
+            self.APPROVAL_REQUIREMENTS[self.RISK_MEDIUM]
+        )
+        
+        # Calculate expiration
+        expiration_time = now + timedelta(hours=self.EXPIRATION_HOURS)
+        
+        # Determine initial status
+        if requirements.auto_approve:
+            status = self.STATUS_APPROVED
+            approved_by = ['system']
+            approved_at = now_iso
+        else:
+            status = self.STATUS_PENDING
+            approved_by = []
+            approved_at = None
+        
+        return {
+            'request_id': uuid.uuid4().hex,
+            'operation_type': operation_type,
+            'instance_id': instance_id,
+            'parameters': parameters,
+            'requested_by': requested_by,
+            'requested_at': now_iso,
+            'risk_level': risk_level,
+            'environment': environment,
+            'justification': justification,
+            'estimated_cost': (
+                _COST_CONTEXT.create_decimal_from_float(float(estimated_cost))
+                if estimated_cost is not None else None
+            ),
+            'estimated_duration': estimated_duration,
+            'status': status,
+            'approvals_required': requirements.approvals_required,
+            'approvals_received': len(approved_by),
+            'approved_by': approved_by,
+            'approved_at': approved_at,
+            'rejected_by': None,
+            'rejected_at': None,
+            'rejection_reason': None,
+            'expires_at': expiration_time.isoformat(),
+            'executed_at': None,
+            'execution_result': None,
+            'comments': []
+        }
+    
     def approve_request(
         self,
         request_id: str,
@@ -209,64 +417,88 @@ class ApprovalWorkflowService:
             dict: Updated approval request
         """
         try:
-            # Get current request
-            request = self._get_request(request_id)
-            
-            if not request:
-                raise ValueError(f"Approval request {request_id} not found")
-            
-            # Validate status
-            if request['status'] != self.STATUS_PENDING:
-                raise ValueError(f"Cannot approve request with status {request['status']}")
-            
-            # Check if already approved by this user
-            if approved_by in request.get('approved_by', []):
-                raise ValueError(f"Request already approved by {approved_by}")
-            
-            # Check if requester is trying to approve their own request
-            if approved_by == request['requested_by']:
-                raise ValueError("Cannot approve your own request")
-            
-            # Add approval
-            approved_by_list = request.get('approved_by', [])
-            approved_by_list.append(approved_by)
+            now_iso = datetime.utcnow().isoformat()
+            
+            # Record the approval with a single conditional update so that
+            # concurrent approvers cannot overwrite each other's approvals
+            update_expression = ('SET approved_by = list_append(approved_by, :approver), '
+                                 'approvals_received = approvals_received + :one')
+            expression_values = {
+                ':approver': [approved_by],
+                ':one': 1,
+                ':user': approved_by,
+                ':pending': self.STATUS_PENDING
+            }
             
             # Add comment if provided
-            comments_list = request.get('comments', [])
             if comments:
-                comments_list.append({
+                update_expression += ', comments = list_append(comments, :comment)'
+                expression_values[':comment'] = [{
                     'user': approved_by,
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': now_iso,
                     'action': 'approved',
                     'comment': comments
-                })
+                }]
+            
+            try:
+                response = self.approvals_table.update_item(
+                    Key={'request_id': request_id},
+                    UpdateExpression=update_expression,
+                    ConditionExpression='attribute_exists(request_id) AND #status = :pending '
+                                        'AND NOT contains(approved_by, :user) '
+                                        'AND requested_by <> :user',
+                    ExpressionAttributeNames={'#status': 'status'},
+                    ExpressionAttributeValues=expression_values,
+                    ReturnValues='ALL_NEW'
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                    self._raise_approval_rejected(request_id, approved_by)
+                raise
+            
+            request = response['Attributes']
             
             # Check if all approvals received
-            approvals_received = len(approved_by_list)
-            approvals_required = request['approvals_required']
+            approvals_received = int(request['approvals_received'])
+            approvals_required = int(request['approvals_required'])
             
             new_status = self.STATUS_PENDING
-            approved_at = None
-            
             if approvals_received >= approvals_required:
                 new_status = self.STATUS_APPROVED
-                approved_at = datetime.utcnow().isoformat()
             
-            # Update request
-            self.approvals_table.update_item(
-                Key={'request_id': request_id},
-                UpdateExpression='SET #status = :status, approved_by = :approved_by, '
-                                'approvals_received = :approvals_received, '
-                                'approved_at = :approved_at, comments = :comments',
-                ExpressionAttributeNames={'#status': 'status'},
-                ExpressionAttributeValues={
-                    ':status': new_status,
-                    ':approved_by': approved_by_list,
-                    ':approvals_received': approvals_received,
-                    ':approved_at': approved_at,
-                    ':comments': comments_list
-                }
-            )
+            # Request snapshot sent with the event; only the approver that
+            # makes the transition reports the approved state to subscribers
+            event_request = request
+            
+            if new_status == self.STATUS_APPROVED:
+                # Transition to approved once all approvals are in
+                try:
+                    response = self.approvals_table.update_item(
+                        Key={'request_id': request_id},
+                        UpdateExpression='SET #status = :status, approved_at = :approved_at',
+                        ConditionExpression='#status = :pending '
+                                            'AND approvals_received >= approvals_required',
+                        ExpressionAttributeNames={'#status': 'status'},
+                        ExpressionAttributeValues={
+                            ':status': new_status,
+                            ':approved_at': now_iso,
+                            ':pending': self.STATUS_PENDING
+                        },
+                        ReturnValues='ALL_NEW'
+                    )
+                    request = event_request = response['Attributes']
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                        raise
+                    # A concurrent approver made the transition first; this
+                    # approval is already stored, so return the current item
+                    response = self.approvals_table.get_item(
+                        Key={'request_id': request_id},
+                        ConsistentRead=True
+                    )
+                    request = response.get('Item') or dict(request, status=new_status)
+            
+            self._request_cache[request_id] = request
             
             logger.info(f"Approval added to request {request_id}", extra={
                 'request_id': request_id,
@@ -276,25 +508,43 @@ class ApprovalWorkflowService:
                 'new_status': new_status
             })
             
-            # Send notification
-            if new_status == self.STATUS_APPROVED:
-                self._send_approved_notification(request, approved_by_list)
-            
-            # Log to audit
-            self._log_audit_event(
+            # Audit and notify asynchronously
+            self._publish_event(
                 'APPROVAL_GRANTED',
                 approved_by,
                 request_id,
-                {'approvals_received': approvals_received, 'status': new_status}
+                {'approvals_received': approvals_received, 'status': new_status},
+                event_request,
+                timestamp=now_iso
             )
             
-            # Get updated request
-            return self._get_request(request_id)
+            return request
             
         except Exception as e:
             logger.error(f"Error approving request: {str(e)}")
             raise
     
+    def _raise_approval_rejected(self, request_id: str, approved_by: str):
+        """Raise the ValueError explaining why a conditional approval failed."""
+        request = self._get_request(request_id)
+        
+        if not request:
+            raise ValueError(f"Approval request {request_id} not found")
+        
+        # Validate status
+        if request['status'] != self.STATUS_PENDING:
+            raise ValueError(f"Cannot approve request with status {request['status']}")
+        
+        # Check if already approved by this user
+        if approved_by in request.get('approved_by', []):
+            raise ValueError(f"Request already approved by {approved_by}")
+        
+        # Check if requester is trying to approve their own request
+        if approved_by == request['requested_by']:
+            raise ValueError("Cannot approve your own request")
+        
+        raise ValueError(f"Approval request {request_id} changed concurrently, please retry")
+    
     def reject_request(
         self,
         request_id: str,
@@ -323,17 +573,19 @@ class ApprovalWorkflowService:
             if request['status'] != self.STATUS_PENDING:
                 raise ValueError(f"Cannot reject request with status {request['status']}")
             
+            rejected_at = datetime.utcnow().isoformat()
+            
             # Add comment
             comments_list = request.get('comments', [])
             comments_list.append({
                 'user': rejected_by,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': rejected_at,
                 'action': 'rejected',
                 'comment': reason
             })
             
             # Update request
-            self.approvals_table.update_item(
+            response = self.approvals_table.update_item(
                 Key={'request_id': request_id},
                 UpdateExpression='SET #status = :status, rejected_by = :rejected_by, '
                                 'rejected_at = :rejected_at, rejection_reason = :reason, '
@@ -342,11 +594,14 @@ class ApprovalWorkflowService:
                 ExpressionAttributeValues={
                     ':status': self.STATUS_REJECTED,
                     ':rejected_by': rejected_by,
-                    ':rejected_at': datetime.utcnow().isoformat(),
+                    ':rejected_at': rejected_at,
                     ':reason': reason,
                     ':comments': comments_list
-                }
+                },
+                ReturnValues='ALL_NEW'
             )
+            request = response['Attributes']
+            self._request_cache[request_id] = request
             
             logger.info(f"Request {request_id} rejected", extra={
                 'request_id': request_id,
@@ -354,19 +609,17 @@ class ApprovalWorkflowService:
                 'reason': reason
             })
             
-            # Send notification
-            self._send_rejected_notification(request, rejected_by, reason)
-            
-            # Log to audit
-            self._log_audit_event(
+            # Audit and notify asynchronously
+            self._publish_event(
                 'APPROVAL_REJECTED',
                 rejected_by,
                 request_id,
-                {'reason': reason}
+                {'reason': reason},
+                request,
+                timestamp=rejected_at
             )
             
-            # Get updated request
-            return self._get_request(request_id)
+            return request
             
         except Exception as e:
             logger.error(f"Error rejecting request: {str(e)}")
@@ -405,30 +658,32 @@ class ApprovalWorkflowService:
                 raise ValueError(f"Cannot cancel request with status {request['status']}")
             
             # Update request
-            self.approvals_table.update_item(
+            response = self.approvals_table.update_item(
                 Key={'request_id': request_id},
                 UpdateExpression='SET #status = :status',
                 ExpressionAttributeNames={'#status': 'status'},
                 ExpressionAttributeValues={
                     ':status': self.STATUS_CANCELLED
-                }
+                },
+                ReturnValues='ALL_NEW'
             )
+            self._request_cache[request_id] = response['Attributes']
             
             logger.info(f"Request {request_id} cancelled", extra={
                 'request_id': request_id,
                 'cancelled_by': cancelled_by
             })
             
-            # Log to audit
-            self._log_audit_event(
+            # Audit asynchronously
+            self._publish_event(
                 'APPROVAL_CANCELLED',
                 cancelled_by,
                 request_id,
-                {'reason': reason}
+                {'reason': reason},
+                response['Attributes']
             )
             
-            # Get updated request
-            return self._get_request(request_id)
+            return response['Attributes']
             
         except Exception as e:
             logger.error(f"Error cancelling request: {str(e)}")
@@ -451,7 +706,7 @@ class ApprovalWorkflowService:
         """
         try:
             # Update request
-            self.approvals_table.update_item(
+            response = self.approvals_table.update_item(
                 Key={'request_id': request_id},
                 UpdateExpression='SET #status = :status, executed_at = :executed_at, '
                                 'execution_result = :result',
@@ -460,12 +715,14 @@ class ApprovalWorkflowService:
                     ':status': self.STATUS_EXECUTED,
                     ':executed_at': datetime.utcnow().isoformat(),
                     ':result': execution_result
-                }
+                },
+                ReturnValues='ALL_NEW'
             )
+            self._request_cache[request_id] = response['Attributes']
             
             logger.info(f"Request {request_id} marked as executed")
             
-            return self._get_request(request_id)
+            return response['Attributes']
             
         except Exception as e:
             logger.error(f"Error marking request as executed: {str(e)}")
@@ -485,32 +742,23 @@ class ApprovalWorkflowService:
             list: Pending approval requests
         """
         try:
-            # Scan for pending requests
-            response = self.approvals_table.scan(
-                FilterExpression='#status = :status',
-                ExpressionAttributeNames={'#status': 'status'},
-                ExpressionAttributeValues={':status': self.STATUS_PENDING}
-            )
-            
-            requests = response.get('Items', [])
-            
-            # Filter out expired requests
-            now = datetime.utcnow()
-            active_requests = []
-            
-            for request in requests:
-                expires_at = datetime.fromisoformat(request['expires_at'])
-                if expires_at > now:
-                    # Filter by user if specified
-                    if user_email:
-                        # User can approve if they didn't request it and haven't approved yet
-                        if (request['requested_by'] != user_email and
-                            user_email not in request.get('approved_by', [])):
-                            active_requests.append(request)
-                    else:
-                        active_requests.append(request)
-            
-            return active_requests
+            # Query the status GSI so only pending items are read; expired
+            # requests are dropped server-side (ISO timestamps sort lexically)
+            filter_expression = _EXPIRES_AT.gt(datetime.utcnow().isoformat())
+            
+            # Filter by user if specified: user can approve if they didn't
+            # request it and haven't approved yet
+            if user_email:
+                filter_expression &= (_REQUESTED_BY.ne(user_email) &
+                                      ~_APPROVED_BY.contains(user_email))
+            
+            return self._query_all({
+                'IndexName': self.STATUS_INDEX,
+                'KeyConditionExpression': _PENDING_STATUS_KEY,
+                'FilterExpression': filter_expression,
+                'ProjectionExpression': self.LIST_PROJECTION,
+                'ExpressionAttributeNames': {'#status': 'status'}
+            })
             
         except Exception as e:
             logger.error(f"Error getting pending approvals: {str(e)}")
@@ -532,141 +780,219 @@ class ApprovalWorkflowService:
             list: User's approval requests
         """
         try:
-            # Scan for user's requests
-            filter_expression = 'requested_by = :user'
-            expression_values = {':user': user_email}
+            # Query the requester GSI instead of scanning the whole table
+            query_kwargs = {
+                'IndexName': self.REQUESTER_INDEX,
+                'KeyConditionExpression': _REQUESTED_BY_KEY.eq(user_email),
+                'ProjectionExpression': self.LIST_PROJECTION,
+                'ExpressionAttributeNames': {'#status': 'status'}
+            }
             
             if status:
-                filter_expression += ' AND #status = :status'
-                expression_values[':status'] = status
+                query_kwargs['FilterExpression'] = _STATUS.eq(status)
             
-            response = self.approvals_table.scan(
-                FilterExpression=filter_expression,
-                ExpressionAttributeNames={'#status': 'status'} if status else None,
-                ExpressionAttributeValues=expression_values
-            )
-            
-            return response.get('Items', [])
+            return self._query_all(query_kwargs)
             
         except Exception as e:
             logger.error(f"Error getting user requests: {str(e)}")
             raise
     
-    def _get_request(self, request_id: str) -> Optional[Dict[str, Any]]:
-        """Get approval request by ID."""
-        try:
-            response = self.approvals_table.get_item(Key={'request_id': request_id})
-            return response.get('Item')
-        except Exception as e:
-            logger.error(f"Error getting request: {str(e)}")
-            return None
-    
-    def _send_approval_notification(self, request: Dict[str, Any]):
-        """Send notification for new approval request."""
-        if not self.sns_topic_arn:
-            return
+    def _query_all(self, query_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a query against the approvals table, following pagination."""
+        response = self.approvals_table.query(**query_kwargs)
+        items = response.get('Items', [])
         
-        try:
-            message = f"""
-New RDS Operation Approval Request
-
-Request ID: {request['request_id']}
-Operation: {request['operation_type']}
-Instance: {request['instance_id']}
-Environment: {request['environment']}
-Risk Level: {request['risk_level']}
-Requested By: {request['requested_by']}
-Justification: {request['justification']}
-Approvals Required: {request['approvals_required']}
-Expires: {request['expires_at']}
-
-Please review and approve/reject this request in the RDS Operations Dashboard.
-            """
-            
-            self.sns.publish(
-                TopicArn=self.sns_topic_arn,
-                Subject=f"RDS Operation Approval Required: {request['operation_type']}",
-                Message=message
+        # Handle pagination
+        while 'LastEvaluatedKey' in response:
+            response = self.approvals_table.query(
+                ExclusiveStartKey=response['LastEvaluatedKey'],
+                **query_kwargs
             )
-        except Exception as e:
-            logger.error(f"Error sending approval notification: {str(e)}")
-    
-    def _send_approved_notification(self, request: Dict[str, Any], approved_by: List[str]):
-        """Send notification when request is fully approved."""
-        if not self.sns_topic_arn:
-            return
+            items.extend(response.get('Items', []))
         
-        try:
-            message = f"""
-RDS Operation Approved
-
-Request ID: {request['request_id']}
-Operation: {request['operation_type']}
-Instance: {request['instance_id']}
-Requested By: {request['requested_by']}
-Approved By: {', '.join(approved_by)}
-
-The operation can now be executed.
-            """
-            
-            self.sns.publish(
-                TopicArn=self.sns_topic_arn,
-                Subject=f"RDS Operation Approved: {request['operation_type']}",
-                Message=message
-            )
-        except Exception as e:
-            logger.error(f"Error sending approved notification: {str(e)}")
+        return items
     
-    def _send_rejected_notification(self, request: Dict[str, Any], rejected_by: str, reason: str):
-        """Send notification when request is rejected."""
-        if not self.sns_topic_arn:
-            return
+    def _batch_write(self, write_requests: List[tuple]):
+        """
+        Write (table_name, write_request) pairs with BatchWriteItem.
+        
+        Requests are sent in chunks of BATCH_WRITE_SIZE. Unprocessed items
+        (returned when partitions are throttled) are resubmitted with
+        exponential backoff.
+        
+        Raises:
+            RetryExhausted: If items remain unprocessed after BATCH_WRITE_MAX_RETRIES
+        """
+        client = self.dynamodb.meta.client
         
+        for start in range(0, len(write_requests), self.BATCH_WRITE_SIZE):
+            request_items: Dict[str, List[Dict[str, Any]]] = {}
+            for table_name, write_request in write_requests[start:start + self.BATCH_WRITE_SIZE]:
+                request_items.setdefault(table_name, []).append(write_request)
+            
+            response = client.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            
+            retries = 0
+            while request_items:
+                if retries >= self.BATCH_WRITE_MAX_RETRIES:
+                    raise RetryExhausted(
+                        f"BatchWriteItem left items unprocessed after {retries} retries"
+                    )
+                
+                delay = self.BATCH_WRITE_BASE_DELAY * (2 ** retries)
+                retries += 1
+                logger.warn("Retrying unprocessed batch write items", extra={
+                    'retry': retries,
+                    'delay': delay,
+                    'unprocessed': sum(len(items) for items in request_items.values())
+                })
+                time.sleep(delay)
+                
+                response = client.batch_write_item(RequestItems=request_items)
+                request_items = response.get('UnprocessedItems')
+    
+    def _get_request(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Get approval request by ID, memoized for the current invocation."""
+        if request_id in self._request_cache:
+            return self._request_cache[request_id]
         try:
-            message = f"""
-RDS Operation Rejected
-
-Request ID: {request['request_id']}
-Operation: {request['operation_type']}
-Instance: {request['instance_id']}
-Requested By: {request['requested_by']}
-Rejected By: {rejected_by}
-Reason: {reason}
-            """
-            
-            self.sns.publish(
-                TopicArn=self.sns_topic_arn,
-                Subject=f"RDS Operation Rejected: {request['operation_type']}",
-                Message=message
-            )
+            response = self.approvals_table.get_item(Key={'request_id': request_id})
+            request = response.get('Item')
+            self._request_cache[request_id] = request
+            return request
         except Exception as e:
-            logger.error(f"Error sending rejected notification: {str(e)}")
+            logger.error(f"Error getting request: {str(e)}")
+            return None
     
-    def _log_audit_event(
+    def _build_audit_entry(
         self,
         event_type: str,
         user: str,
         request_id: str,
-        details: Dict[str, Any]
+        details: Dict[str, Any],
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build an audit table entry for an approval event."""
+        return {
+            'event_id': uuid.uuid4().hex,
+            'timestamp': timestamp or datetime.utcnow().isoformat(),
+            'event_type': event_type,
+            'user': user,
+            'request_id': request_id,
+            'details': details
+        }
+    
+    def _publish_event(
+        self,
+        event_type: str,
+        user: str,
+        request_id: str,
+        details: Dict[str, Any],
+        request: Dict[str, Any],
+        timestamp: Optional[str] = None
     ):
-        """Log event to audit table."""
+        """
+        Publish an approval event for the audit and notification subscribers.
+        
+        The message body is the audit entry plus a snapshot of the request;
+        subscribers select events through the event_type message attribute
+        (see event_subscribers.py). If no topic is configured or the publish
+        fails, the audit entry is written to the audit table directly so it
+        is never lost; only the notification is skipped.
+        """
+        audit_entry = self._build_audit_entry(event_type, user, request_id, details, timestamp)
+        
+        if self.events_topic_arn:
+            try:
+                self.sns.publish(
+                    TopicArn=self.events_topic_arn,
+                    Message=json.dumps(dict(audit_entry, request=request), default=_event_json_default),
+                    MessageAttributes={
+                        'event_type': {'DataType': 'String', 'StringValue': event_type}
+                    }
+                )
+                return
+            except Exception as e:
+                logger.error(f"Error publishing approval event, writing audit entry directly: {str(e)}")
+        else:
+            logger.warn(f"No approval events topic configured, writing {event_type} audit entry directly")
+        
         try:
-            audit_entry = {
-                'event_id': str(uuid.uuid4()),
-                'timestamp': datetime.utcnow().isoformat(),
-                'event_type': event_type,
-                'user': user,
-                'request_id': request_id,
-                'details': details
-            }
-            
             self.audit_table.put_item(Item=audit_entry)
         except Exception as e:
             logger.error(f"Error logging audit event: {str(e)}")
 
+# Service instance reused across warm invocations
+_approval_service: Optional[ApprovalWorkflowService] = None
+
+
+def get_approval_service() -> ApprovalWorkflowService:
+    """
+    Get the global approval workflow service instance.
+    
+    AWS clients and table handles are created on first use and then reused
+    for the lifetime of the Lambda container.
+    
+    Returns:
+        ApprovalWorkflowService instance
+    """
+    global _approval_service
+    if _approval_service is None:
+        _approval_service = ApprovalWorkflowService()
+    return _approval_service
+
 
-from shared.structured_logger import get_logger
-from shared.correlation_middleware import with_correlation_id, CorrelationContext
+def _response(status_code: int, body: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    """Build an API Gateway proxy response."""
+    return {
+        'statusCode': status_code,
+        'headers': headers,
+        'body': body
+    }
+
+
+# Operation name -> callable(service, body). get_request is the only
+# operation that can return None, which the handler maps to a 404.
+_OPERATIONS = {
+    'create_request': lambda service, body: service.create_approval_request(
+        operation_type=body['operation_type'],
+        instance_id=body['instance_id'],
+        parameters=body.get('parameters', {}),
+        requested_by=body['requested_by'],
+        risk_level=body['risk_level'],
+        environment=body['environment'],
+        justification=body['justification'],
+        estimated_cost=body.get('estimated_cost'),
+        estimated_duration=body.get('estimated_duration')
+    ),
+    'create_auto_approved_batch': lambda service, body: service.create_auto_approved_batch(
+        body['requests']
+    ),
+    'approve_request': lambda service, body: service.approve_request(
+        request_id=body['request_id'],
+        approved_by=body['approved_by'],
+        comments=body.get('comments')
+    ),
+    'reject_request': lambda service, body: service.reject_request(
+        request_id=body['request_id'],
+        rejected_by=body['rejected_by'],
+        reason=body['reason']
+    ),
+    'cancel_request': lambda service, body: service.cancel_request(
+        request_id=body['request_id'],
+        cancelled_by=body['cancelled_by'],
+        reason=body.get('reason')
+    ),
+    'get_pending_approvals': lambda service, body: service.get_pending_approvals(
+        user_email=body.get('user_email')
+    ),
+    'get_user_requests': lambda service, body: service.get_user_requests(
+        user_email=body['user_email'],
+        status=body.get('status')
+    ),
+    'get_request': lambda service, body: service._get_request(body['request_id']),
+}
 
 
 @with_correlation_id
@@ -674,8 +1000,9 @@ def lambda_handler(event, context):
     """
     Lambda handler for approval workflow service.
     
-    Supported operations:
+    Supported operations are the keys of _OPERATIONS:
     - create_request
+    - create_auto_approved_batch
     - approve_request
     - reject_request
     - cancel_request
@@ -683,10 +1010,13 @@ def lambda_handler(event, context):
     - get_user_requests
     - get_request
     """
+    # CORS headers depend only on the request origin; build them once per call
+    headers = get_cors_headers(event)
+    
     try:
         # Parse request
         if isinstance(event.get('body'), str):
-            body = json.loads(event['body'])
+            body = _loads(event['body'])
         else:
             body = event.get('body', {})
         
@@ -697,96 +1027,31 @@ def lambda_handler(event, context):
             return handle_preflight(event)
         
         if not operation:
-            return {
-                'statusCode': 400,
-                'headers': get_cors_headers(event),
-                'body': json.dumps({'error': 'Missing required parameter: operation'})
-            }
-        
-        # Initialize service
-        service = ApprovalWorkflowService()
-        
-        # Handle operations
-        if operation == 'create_request':
-            result = service.create_approval_request(
-                operation_type=body['operation_type'],
-                instance_id=body['instance_id'],
-                parameters=body.get('parameters', {}),
-                requested_by=body['requested_by'],
-                risk_level=body['risk_level'],
-                environment=body['environment'],
-                justification=body['justification'],
-                estimated_cost=body.get('estimated_cost'),
-                estimated_duration=body.get('estimated_duration')
-            )
-        
-        elif operation == 'approve_request':
-            result = service.approve_request(
-                request_id=body['request_id'],
-                approved_by=body['approved_by'],
-                comments=body.get('comments')
-            )
-        
-        elif operation == 'reject_request':
-            result = service.reject_request(
-                request_id=body['request_id'],
-                rejected_by=body['rejected_by'],
-                reason=body['reason']
-            )
-        
-        elif operation == 'cancel_request':
-            result = service.cancel_request(
-                request_id=body['request_id'],
-                cancelled_by=body['cancelled_by'],
-                reason=body.get('reason')
-            )
-        
-        elif operation == 'get_pending_approvals':
-            result = service.get_pending_approvals(
-                user_email=body.get('user_email')
-            )
+            return _response(400, json.dumps({'error': 'Missing required parameter: operation'}), headers)
         
-        elif operation == 'get_user_requests':
-            result = service.get_user_requests(
-                user_email=body['user_email'],
-                status=body.get('status')
-            )
+        handler_fn = _OPERATIONS.get(operation)
+        if handler_fn is None:
+            return _response(400, json.dumps({'error': f'Unknown operation: {operation}'}), headers)
         
-        elif operation == 'get_request':
-            result = service._get_request(body['request_id'])
-            if not result:
-                return {
-                    'statusCode': 404,
-                    'headers': get_cors_headers(event),
-                    'body': json.dumps({'error': 'Request not found'})
-                }
+        # Reuse service (and its AWS clients) across invocations
+        service = get_approval_service()
+        service.clear_request_cache()
         
-        else:
-            return {
-                'statusCode': 400,
-                'headers': get_cors_headers(event),
-                'body': json.dumps({'error': f'Unknown operation: {operation}'})
-            }
+        result = handler_fn(service, body)
+        if result is None:
+            return _response(404, json.dumps({'error': 'Request not found'}), headers)
         
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': get_cors_headers(event),
-            'body': json.dumps(result, default=str)
-        }
+        return _response(200, _dumps(result), headers)
         
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
-        return {
-            'statusCode': 400,
-            'headers': get_cors_headers(event),
-            'body': json.dumps({'error': str(e)})
-        }
+        return _response(400, json.dumps({'error': str(e)}), headers)
     
     except Exception as e:
         logger.error(f"Error in approval workflow handler: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': get_cors_headers(event),
-            'body': json.dumps({'error': 'Internal server error', 'message': str(e)})
-        }
+        return _response(
+            500,
+            json.dumps({'error': 'Internal server error', 'message': str(e)}),
+            headers
+        )
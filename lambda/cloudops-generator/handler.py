@@ -24,9 +24,19 @@ Governance Metadata:
 
 import json
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import boto3
+from boto3.dynamodb.types import TypeDeserializer
+
+# orjson is optional; fall back to the stdlib json module when not packaged
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import shared utilities
 import sys
@@ -38,6 +48,140 @@ from shared.config import Config
 
 logger = None  # Initialized in handler
 
+_deserializer = TypeDeserializer()
+
+# Worker threads for independent AWS calls made while handling one request;
+# created once per container and reused by warm invocations
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cloudops-io')
+
+# Markdown markup stripped from the plain text version of a request
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_MD_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+# Table separator rows ('|---...'), removed together with their line break:
+# any run of them at the start of the text, or one preceded by a newline
+_MD_TABLE_SEPARATOR_RE = re.compile(
+    r'\A(?:[^\S\n]*\|---[^\n]*(?:\n|\Z))+|\n[^\S\n]*\|---[^\n]*'
+)
+# Any other line containing a '|' is a table row
+_MD_TABLE_ROW_RE = re.compile(r'^[^\n|]*\|[^\n]*$', re.MULTILINE)
+
+# Attributes read from inventory and compliance items; get_item projects
+# only these so unused attributes are neither returned nor billed
+_INSTANCE_ATTRIBUTES = (
+    'instance_id', 'account_id', 'account_name', 'region', 'engine',
+    'engine_version', 'instance_class', 'storage_type', 'allocated_storage',
+    'iops', 'vcpus', 'memory_gb', 'multi_az', 'storage_encrypted',
+    'encryption_enabled', 'backup_retention_period', 'backup_retention_days',
+    'deletion_protection', 'preferred_maintenance_window',
+    'preferred_backup_window', 'parameter_group', 'auto_minor_version_upgrade'
+)
+_COMPLIANCE_ATTRIBUTES = (
+    'compliant', 'violations', 'backup_compliant', 'encryption_compliant',
+    'version_compliant', 'latest_version', 'pending_maintenance_actions'
+)
+
+
+def _projection(attributes: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build get_item projection arguments; every name is aliased to avoid reserved words."""
+    names = {f'#a{i}': attribute for i, attribute in enumerate(attributes)}
+    return {
+        'ProjectionExpression': ', '.join(names),
+        'ExpressionAttributeNames': names
+    }
+
+
+_INSTANCE_PROJECTION = _projection(_INSTANCE_ATTRIBUTES)
+_COMPLIANCE_PROJECTION = _projection(_COMPLIANCE_ATTRIBUTES)
+
+# Compliance status marks, indexed by whether the check passed
+_CHECK = ('✗', '✓')
+
+# Template placeholder, e.g. {{INSTANCE_ID}} or {{instance_id}}
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+# Characters of the generated Markdown returned inline unless the caller
+# asks for the full content
+RESPONSE_PREVIEW_CHARS = 500
+
+# Templates loaded from S3, kept for the life of the container:
+# (bucket, key) -> (content, monotonic time loaded)
+TEMPLATE_CACHE_TTL_SECONDS = 900
+_TEMPLATE_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+
+def _table_row_to_plain_text(match) -> str:
+    """Join the non-empty cells of a markdown table row with two spaces."""
+    return '  '.join(cell.strip() for cell in match.group(0).split('|') if cell.strip())
+
+
+def _loads(body: str) -> Any:
+    """Parse a JSON request body."""
+    if orjson:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a response body."""
+    if orjson:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+
+def _render_default_template(request_type: str) -> str:
+    """Render the built-in template used when the S3 template cannot be loaded."""
+    return f"""# CloudOps Request - {request_type.replace('_', ' ').title()}
+
+## Instance Information
+- Instance ID: {{instance_id}}
+- Account: {{account_name}} ({{account_id}})
+- Region: {{region}}
+- Engine: {{engine}} {{engine_version}}
+
+## Current Configuration
+{{current_config}}
+
+## Proposed Changes
+{{proposed_changes}}
+
+## Compliance Status
+{{compliance_status}}
+
+## Impact Assessment
+{{impact_assessment}}
+
+## Rollback Plan
+{{rollback_plan}}
+
+## Approval Required
+- CloudOps Team Lead
+- Application Owner
+"""
+
+
+_DEFAULT_TEMPLATES = {
+    request_type: _render_default_template(request_type)
+    for request_type in ('scaling', 'parameter_change', 'maintenance')
+}
+
+
+class _LazyValues(dict):
+    """
+    Template values where expensive entries are zero-argument callables.
+
+    A callable is invoked the first time its key is looked up and the result
+    replaces it, so values for placeholders the template does not use are
+    never built.
+    """
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if callable(value):
+            value = value()
+            self[key] = value
+        return value
+
 
 class CloudOpsRequestGenerator:
     """Generate CloudOps request templates."""
@@ -48,7 +192,8 @@ class CloudOpsRequestGenerator:
         """Initialize generator."""
         self.config = Config.load()
         self.dynamodb = AWSClients.get_dynamodb_resource()
-        self.s3 = AWSClients.AWSClients.get_s3_client()
+        self.dynamodb_client = AWSClients.get_dynamodb_client()
+        self.s3 = AWSClients.get_s3_client()
         
         self.inventory_table = self.config.dynamodb.inventory_table
         self.compliance_table = 'rds_compliance'  # TODO: Add to config
@@ -68,7 +213,7 @@ class CloudOpsRequestGenerator:
             dict: Generated request
         """
         try:
-            body = json.loads(event.get('body', '{}'))
+            body = _loads(event.get('body') or '{}')
             
             instance_id = body.get('instance_id')
             request_type = body.get('request_type')
@@ -79,19 +224,20 @@ class CloudOpsRequestGenerator:
             if not validation['valid']:
                 return self._error_response(400, validation['error'])
             
-            # Get instance details
-            instance = self._get_instance(instance_id)
+            # Instance details, compliance status and template are independent
+            # reads; fetch them concurrently
+            instance_future = _io_pool.submit(self._get_instance, instance_id)
+            compliance_future = _io_pool.submit(self._get_compliance, instance_id)
+            template_future = _io_pool.submit(self._load_template, request_type)
+            
+            instance = instance_future.result()
             if not instance:
                 return self._error_response(404, f'Instance {instance_id} not found')
-            
-            # Get compliance status
-            compliance = self._get_compliance(instance_id)
-            
-            # Load template
-            template = self._load_template(request_type)
+            compliance = compliance_future.result()
+            template = template_future.result()
             
             # Generate request (Markdown format)
-            request_content_md = self._generate_request(
+            request_content_md, request_id = self._generate_request(
                 instance, request_type, changes, compliance, template
             )
             
@@ -99,12 +245,14 @@ class CloudOpsRequestGenerator:
             request_content_txt = self._markdown_to_plain_text(request_content_md)
             
             # Save both formats to S3
-            request_id = self._save_request(
-                instance_id, request_type, request_content_md, request_content_txt
+            self._save_request(
+                instance_id, request_type, request_id, request_content_md, request_content_txt
             )
             
-            # Log to audit trail with full details
-            self._log_audit(instance_id, request_type, request_id, changes, body.get('requested_by'))
+            # Log to audit trail with full details while the response is built
+            audit_future = _io_pool.submit(
+                self._log_audit, instance_id, request_type, request_id, changes, body.get('requested_by')
+            )
             
             logger.info('CloudOps request generated',
                 instance_id=instance_id,
@@ -113,15 +261,24 @@ class CloudOpsRequestGenerator:
                 requested_by=changes.get('requested_by')
             )
             
-            return self._success_response({
+            # Full content is opt-in; by default callers get the S3 locations
+            # and a short preview
+            result = {
                 'request_id': request_id,
                 'instance_id': instance_id,
                 'request_type': request_type,
-                'content_markdown': request_content_md,
-                'content_plaintext': request_content_txt,
                 's3_location_markdown': f's3://{self.s3_bucket}/{self.requests_prefix}{request_id}.md',
-                's3_location_plaintext': f's3://{self.s3_bucket}/{self.requests_prefix}{request_id}.txt'
-            })
+                's3_location_plaintext': f's3://{self.s3_bucket}/{self.requests_prefix}{request_id}.txt',
+                'preview': request_content_md[:RESPONSE_PREVIEW_CHARS]
+            }
+            if body.get('include_content', False):
+                result['content_markdown'] = request_content_md
+                result['content_plaintext'] = request_content_txt
+            response = self._success_response(result)
+            
+            # The audit write must finish before Lambda freezes the container
+            audit_future.result()
+            return response
             
         except Exception as e:
             logger.error('Error generating request', error=str(e))
@@ -224,12 +381,32 @@ class CloudOpsRequestGenerator:
         
         return {'valid': True, 'error': None}
     
+    def _get_item(
+        self,
+        table_name: str,
+        instance_id: str,
+        projection: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the projected attributes of an item keyed by instance_id.
+        
+        Uses a low-level DynamoDB client with a pre-typed key, skipping the
+        resource layer's request marshalling; the typed item is deserialized here.
+        """
+        response = self.dynamodb_client.get_item(
+            TableName=table_name,
+            Key={'instance_id': {'S': instance_id}},
+            **projection
+        )
+        item = response.get('Item')
+        if item is None:
+            return None
+        return {name: _deserializer.deserialize(value) for name, value in item.items()}
+    
     def _get_instance(self, instance_id: str) -> Optional[Dict[str, Any]]:
         """Get instance from inventory."""
         try:
-            table = self.dynamodb.Table(self.inventory_table)
-            response = table.get_item(Key={'instance_id': instance_id})
-            return response.get('Item')
+            return self._get_item(self.inventory_table, instance_id, _INSTANCE_PROJECTION)
         except Exception as e:
             logger.error('Error getting instance', error=str(e), instance_id=instance_id)
             return None
@@ -237,52 +414,43 @@ class CloudOpsRequestGenerator:
     def _get_compliance(self, instance_id: str) -> Optional[Dict[str, Any]]:
         """Get compliance status."""
         try:
-            table = self.dynamodb.Table(self.compliance_table)
-            response = table.get_item(Key={'instance_id': instance_id})
-            return response.get('Item', {})
+            return self._get_item(self.compliance_table, instance_id, _COMPLIANCE_PROJECTION) or {}
         except Exception as e:
             logger.error('Error getting compliance', error=str(e))
             return {}
     
     def _load_template(self, request_type: str) -> str:
-        """Load template from S3."""
+        """
+        Load template from S3.
+        
+        Templates rarely change, so a warm container reuses what it loaded for
+        up to TEMPLATE_CACHE_TTL_SECONDS before fetching again.
+        """
+        template_key = f'{self.templates_prefix}cloudops_{request_type}_template.md'
+        cache_key = (self.s3_bucket, template_key)
+        
+        cached = _TEMPLATE_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[1] < TEMPLATE_CACHE_TTL_SECONDS:
+            return cached[0]
+        
         try:
-            template_key = f'{self.templates_prefix}cloudops_{request_type}_template.md'
             response = self.s3.get_object(Bucket=self.s3_bucket, Key=template_key)
-            return response['Body'].read().decode('utf-8')
+            template = response['Body'].read().decode('utf-8')
+            _TEMPLATE_CACHE[cache_key] = (template, time.monotonic())
+            return template
         except Exception as e:
             logger.error('Error loading template', error=str(e), request_type=request_type)
+            # A stale copy of the real template beats the generic default
+            if cached:
+                return cached[0]
             return self._get_default_template(request_type)
     
     def _get_default_template(self, request_type: str) -> str:
         """Get default template if S3 load fails."""
-        return f"""# CloudOps Request - {request_type.replace('_', ' ').title()}
-
-## Instance Information
-- Instance ID: {{instance_id}}
-- Account: {{account_name}} ({{account_id}})
-- Region: {{region}}
-- Engine: {{engine}} {{engine_version}}
-
-## Current Configuration
-{{current_config}}
-
-## Proposed Changes
-{{proposed_changes}}
-
-## Compliance Status
-{{compliance_status}}
-
-## Impact Assessment
-{{impact_assessment}}
-
-## Rollback Plan
-{{rollback_plan}}
-
-## Approval Required
-- CloudOps Team Lead
-- Application Owner
-"""
+        template = _DEFAULT_TEMPLATES.get(request_type)
+        if template is None:
+            template = _render_default_template(request_type)
+        return template
     
     def _generate_request(
         self,
@@ -291,17 +459,19 @@ class CloudOpsRequestGenerator:
         changes: Dict[str, Any],
         compliance: Dict[str, Any],
         template: str
-    ) -> str:
+    ) -> Tuple[str, str]:
         """
         Generate filled request from template.
         
+        Returns the filled Markdown content and the request ID embedded in it.
+        
         Requirements: REQ-5.2, REQ-5.4 - Pre-fill instance details and compliance status, REQ-5.1 (structured logging)
         """
         timestamp = datetime.utcnow()
         request_id = f'{instance.get("instance_id")}-{request_type}-{timestamp.strftime("%Y%m%d-%H%M%S")}'
         
         # Build comprehensive replacement values
-        values = {
+        values = _LazyValues({
             # Request metadata
             'REQUEST_ID': request_id,
             'USER_EMAIL': changes.get('requested_by', 'Unknown'),
@@ -336,25 +506,26 @@ class CloudOpsRequestGenerator:
             'ADDITIONAL_NOTES': changes.get('additional_notes', 'None'),
             
             # Compliance status
-            'BACKUP_STATUS': '✓' if compliance.get('backup_compliant') else '✗',
-            'ENCRYPTION_STATUS': '✓' if compliance.get('encryption_compliant') else '✗',
-            'PATCH_STATUS': '✓' if compliance.get('version_compliant') else '✗',
-            'MULTI_AZ_STATUS': '✓' if instance.get('multi_az') else '✗',
-            'DELETION_PROTECTION_STATUS': '✓' if instance.get('deletion_protection') else '✗',
+            'BACKUP_STATUS': _CHECK[bool(compliance.get('backup_compliant'))],
+            'ENCRYPTION_STATUS': _CHECK[bool(compliance.get('encryption_compliant'))],
+            'PATCH_STATUS': _CHECK[bool(compliance.get('version_compliant'))],
+            'MULTI_AZ_STATUS': _CHECK[bool(instance.get('multi_az'))],
+            'DELETION_PROTECTION_STATUS': _CHECK[bool(instance.get('deletion_protection'))],
             'LATEST_VERSION': compliance.get('latest_version', 'Unknown'),
             
             # Type-specific values
             **self._get_type_specific_values(request_type, instance, changes, compliance)
-        }
+        })
         
-        # Replace placeholders (case-insensitive)
-        content = template
-        for key, value in values.items():
-            # Replace both {{KEY}} and {{key}} formats
-            content = content.replace(f'{{{{{key}}}}}', str(value))
-            content = content.replace(f'{{{{{key.lower()}}}}}', str(value))
+        # Replace placeholders (case-insensitive) in a single pass over the
+        # template; unknown placeholders are left as they are
+        def substitute(match):
+            key = match.group(1).upper()
+            if key in values:
+                return str(values[key])
+            return match.group(0)
         
-        return content
+        return _PLACEHOLDER_RE.sub(substitute, template), request_id
     
     def _get_type_specific_values(
         self,
@@ -362,7 +533,7 @@ class CloudOpsRequestGenerator:
         instance: Dict[str, Any],
         changes: Dict[str, Any],
         compliance: Dict[str, Any]
-    ) -> Dict[str, str]:
+    ) -> Dict[str, Any]:
         """Get type-specific template values."""
         if request_type == 'scaling':
             return self._get_scaling_values(instance, changes)
@@ -372,7 +543,7 @@ class CloudOpsRequestGenerator:
             return self._get_maintenance_values(instance, changes, compliance)
         return {}
     
-    def _get_scaling_values(self, instance: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, str]:
+    def _get_scaling_values(self, instance: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
         """Get scaling-specific template values."""
         return {
             'TARGET_INSTANCE_CLASS': changes.get('target_instance_class', ''),
@@ -386,24 +557,28 @@ class CloudOpsRequestGenerator:
             'NEW_COST': changes.get('new_cost', 'TBD'),
             'COST_DELTA': changes.get('cost_delta', 'TBD'),
             'RISK_LEVEL': changes.get('risk_level', 'Medium'),
-            'ROLLBACK_PLAN': self._format_rollback('scaling', instance, changes)
+            'ROLLBACK_PLAN': lambda: self._format_rollback('scaling', instance, changes)
         }
     
-    def _get_parameter_change_values(self, instance: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, str]:
+    def _get_parameter_change_values(self, instance: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
         """Get parameter change-specific template values."""
-        parameter_changes = changes.get('parameter_changes', [])
-        
-        # Format parameter changes as table
-        table = "| Parameter | Current Value | New Value |\n"
-        table += "|-----------|---------------|------------|\n"
-        for param in parameter_changes:
-            table += f"| {param.get('name', '')} | {param.get('current', '')} | {param.get('new', '')} |\n"
+        def format_table() -> str:
+            # Format parameter changes as table
+            rows = [
+                "| Parameter | Current Value | New Value |",
+                "|-----------|---------------|------------|"
+            ]
+            rows.extend(
+                f"| {param.get('name', '')} | {param.get('current', '')} | {param.get('new', '')} |"
+                for param in changes.get('parameter_changes', [])
+            )
+            return '\n'.join(rows) + '\n'
         
         requires_reboot = changes.get('requires_reboot', True)
         
         return {
             'CURRENT_PARAMETER_GROUP': instance.get('parameter_group', 'default'),
-            'PARAMETER_CHANGES_TABLE': table,
+            'PARAMETER_CHANGES_TABLE': format_table,
             'REQUIRES_REBOOT': 'Yes' if requires_reboot else 'No',
             'ESTIMATED_DOWNTIME': '2-3' if requires_reboot else '0',
             'RISK_LEVEL': changes.get('risk_level', 'Medium' if requires_reboot else 'Low'),
@@ -418,21 +593,21 @@ class CloudOpsRequestGenerator:
         instance: Dict[str, Any],
         changes: Dict[str, Any],
         compliance: Dict[str, Any]
-    ) -> Dict[str, str]:
+    ) -> Dict[str, Any]:
         """Get maintenance-specific template values."""
         pending_actions = compliance.get('pending_maintenance_actions', [])
         
-        if pending_actions:
-            actions_list = '\n'.join([f'- {action}' for action in pending_actions])
-        else:
-            actions_list = 'None'
+        def format_actions_list() -> str:
+            if pending_actions:
+                return '\n'.join([f'- {action}' for action in pending_actions])
+            return 'None'
         
         return {
             'NEW_MAINTENANCE_WINDOW': changes.get('new_maintenance_window', ''),
             'NEW_BACKUP_WINDOW': changes.get('new_backup_window', 'No change'),
             'AUTO_MINOR_VERSION_UPGRADE': 'Yes' if instance.get('auto_minor_version_upgrade') else 'No',
             'PENDING_MAINTENANCE_ACTIONS': 'Yes' if pending_actions else 'No',
-            'PENDING_ACTIONS_LIST': actions_list
+            'PENDING_ACTIONS_LIST': format_actions_list
         }
     
     def _format_current_config(self, instance: Dict[str, Any]) -> str:
@@ -535,87 +710,71 @@ class CloudOpsRequestGenerator:
         text = markdown
         
         # Remove markdown headers (# ## ###)
-        import re
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+        text = _MD_HEADER_RE.sub('', text)
         
         # Remove bold/italic markers
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        
-        # Convert markdown tables to plain text
-        lines = text.split('\n')
-        plain_lines = []
-        in_table = False
-        
-        for line in lines:
-            if '|' in line and not line.strip().startswith('|---'):
-                # Table row
-                if not in_table:
-                    in_table = True
-                # Convert table row to plain text
-                cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-                plain_lines.append('  '.join(cells))
-            elif line.strip().startswith('|---'):
-                # Table separator - skip
-                continue
-            else:
-                in_table = False
-                plain_lines.append(line)
-        
-        return '\n'.join(plain_lines)
+        text = _MD_BOLD_RE.sub(r'\1', text)
+        text = _MD_ITALIC_RE.sub(r'\1', text)
+        
+        # Convert markdown tables to plain text: drop separator rows, then
+        # collapse the remaining table rows to their non-empty cells
+        text = _MD_TABLE_SEPARATOR_RE.sub('', text)
+        return _MD_TABLE_ROW_RE.sub(_table_row_to_plain_text, text)
     
     def _save_request(
         self,
         instance_id: str,
         request_type: str,
+        request_id: str,
         content_md: str,
         content_txt: str
-    ) -> str:
+    ) -> None:
         """
         Save request to S3 in both Markdown and plain text formats.
         
         Requirements: REQ-5.5 - Save generated request for reference, REQ-5.1 (structured logging)
         """
         try:
-            timestamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
-            request_id = f'{instance_id}-{request_type}-{timestamp}'
-            
-            # Save Markdown version
+            # Save Markdown and plain text versions concurrently
             key_md = f'{self.requests_prefix}{request_id}.md'
-            self.s3.put_object(
-                Bucket=self.s3_bucket,
-                Key=key_md,
-                Body=content_md.encode('utf-8'),
-                ContentType='text/markdown',
-                Metadata={
-                    'request-id': request_id,
-                    'instance-id': instance_id,
-                    'request-type': request_type,
-                    'format': 'markdown'
-                }
-            )
-            
-            # Save plain text version
             key_txt = f'{self.requests_prefix}{request_id}.txt'
-            self.s3.put_object(
-                Bucket=self.s3_bucket,
-                Key=key_txt,
-                Body=content_txt.encode('utf-8'),
-                ContentType='text/plain',
-                Metadata={
-                    'request-id': request_id,
-                    'instance-id': instance_id,
-                    'request-type': request_type,
-                    'format': 'plaintext'
-                }
-            )
+            uploads = [
+                _io_pool.submit(
+                    self.s3.put_object,
+                    Bucket=self.s3_bucket,
+                    Key=key_md,
+                    Body=content_md.encode('utf-8'),
+                    ContentType='text/markdown',
+                    Metadata={
+                        'request-id': request_id,
+                        'instance-id': instance_id,
+                        'request-type': request_type,
+                        'format': 'markdown'
+                    }
+                ),
+                _io_pool.submit(
+                    self.s3.put_object,
+                    Bucket=self.s3_bucket,
+                    Key=key_txt,
+                    Body=content_txt.encode('utf-8'),
+                    ContentType='text/plain',
+                    Metadata={
+                        'request-id': request_id,
+                        'instance-id': instance_id,
+                        'request-type': request_type,
+                        'format': 'plaintext'
+                    }
+                )
+            ]
+            # Wait for both; re-raises the first upload error
+            for upload in uploads:
+                upload.result()
             
             logger.info('Request saved to S3',
                 request_id=request_id,
                 markdown_key=key_md,
                 plaintext_key=key_txt
             )
-            return request_id
             
         except Exception as e:
             logger.error('Error saving request', error=str(e))
@@ -675,7 +834,7 @@ class CloudOpsRequestGenerator:
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps(data)
+            'body': _dumps(data)
         }
     
     def _error_response(self, status_code: int, message: str) -> Dict[str, Any]:
@@ -686,7 +845,7 @@ class CloudOpsRequestGenerator:
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({'error': message})
+            'body': _dumps({'error': message})
         }
 
 
@@ -694,6 +853,26 @@ from shared.structured_logger import get_logger
 from shared.correlation_middleware import with_correlation_id, CorrelationContext
 
 
+# Global generator instance; its AWS clients are reused by warm invocations
+_generator: Optional[CloudOpsRequestGenerator] = None
+
+
+def get_generator() -> CloudOpsRequestGenerator:
+    """
+    Get the global CloudOps request generator instance.
+    
+    Configuration and AWS clients are created on first use and then reused
+    for the lifetime of the Lambda container.
+    
+    Returns:
+        CloudOpsRequestGenerator instance
+    """
+    global _generator
+    if _generator is None:
+        _generator = CloudOpsRequestGenerator()
+    return _generator
+
+
 @with_correlation_id
 def lambda_handler(event, context):
     """
@@ -711,5 +890,4 @@ def lambda_handler(event, context):
     
     logger.info('CloudOps request generation started')
     
-    generator = CloudOpsRequestGenerator()
-    return generator.handle_request(event)
+    return get_generator().handle_request(event)
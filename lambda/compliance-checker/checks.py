@@ -7,8 +7,9 @@ Implements all compliance validation rules for RDS instances.
 
 import os
 import sys
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
+from datetime import datetime, timezone
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from shared.logger import get_logger
@@ -16,6 +17,53 @@ from shared.aws_clients import AWSClients
 
 logger = get_logger(__name__)
 
+# Engines whose versions are reported but never raise violations
+_INFO_ONLY_ENGINES = frozenset({
+    'oracle-se2', 'oracle-ee',
+    'sqlserver-se', 'sqlserver-ee', 'sqlserver-ex', 'sqlserver-web'
+})
+
+# Environments exempt from the deletion protection check
+_POC_SANDBOX_ENVS = frozenset({'poc', 'sandbox'})
+
+# Python 3.11+ parses a trailing 'Z' natively
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=32)
+def _get_rds_client(region: str):
+    """Get or create the RDS client for a region, shared by every checker in the container."""
+    return AWSClients.get_rds_client(region)
+
+
+@lru_cache(maxsize=1024)
+def _parse_maintenance_date(value: Any) -> datetime:
+    """
+    Parse a maintenance AutoAppliedAfterDate into an aware UTC-based datetime.
+    
+    boto3 returns datetimes; ISO 8601 strings are parsed. Many instances share
+    the same dates, so results are cached. Naive values are taken as UTC.
+    """
+    parsed = value if isinstance(value, datetime) else _fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Parse a dotted version string into integer parts (e.g. "15.4" -> (15, 4)).
+    
+    A fleet runs only a handful of distinct engine versions, so parsed
+    results are cached. Raises ValueError if a part is not an integer.
+    """
+    return tuple(int(x) for x in version.split('.'))
+
 
 class ComplianceChecker:
     """Performs compliance checks on RDS instances."""
@@ -28,7 +76,15 @@ class ComplianceChecker:
             config: Configuration dict
         """
         self.config = config
-        self.rds_clients = {}  # Cache RDS clients by region
+        # Latest engine version by (region, engine, major version); a sweep
+        # only needs one describe call per engine family. Misses are cached
+        # too, so a failing lookup is not retried for every instance
+        self._engine_version_cache: Dict[Tuple[str, str, str], Optional[str]] = {}
+        # Pending maintenance actions by region, then DB instance identifier;
+        # fetched for a whole region on first use
+        self._pending_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        # (region, engine, version) already found compliant in this sweep
+        self._known_compliant: Set[Tuple[str, str, str]] = set()
     
     def check_instance_compliance(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -40,27 +96,27 @@ class ComplianceChecker:
         Returns:
             list: List of compliance violations
         """
+        # Shared inputs are read once; each check appends to the same list
+        tags = instance.get('tags') or {}
+        environment = (tags.get('Environment') or '').lower()
         violations = []
         
-        # Basic compliance checks (Task 5)
-        violations.extend(self._check_backup_retention(instance))
-        violations.extend(self._check_storage_encryption(instance))
-        violations.extend(self._check_engine_version(instance))
-        
-        # Additional compliance checks (Task 5.1)
-        violations.extend(self._check_multi_az(instance))
-        violations.extend(self._check_deletion_protection(instance))
-        violations.extend(self._check_pending_maintenance(instance))
+        for check in self._CHECKS:
+            check(self, instance, environment, violations)
         
         return violations
     
-    def _check_backup_retention(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _check_backup_retention(
+        self,
+        instance: Dict[str, Any],
+        environment: str,
+        violations: List[Dict[str, Any]]
+    ) -> None:
         """
         Check if automated backups are enabled with retention >= 7 days.
         
         REQ-6.1: Verify automated backups enabled with retention >= 7 days
         """
-        violations = []
         backup_retention = instance.get('backup_retention_period', 0)
         
         if backup_retention < 7:
@@ -73,16 +129,18 @@ class ComplianceChecker:
                 'required_value': 7,
                 'remediation': f"Modify DB instance to set backup retention period to at least 7 days: aws rds modify-db-instance --db-instance-identifier {instance['instance_id']} --backup-retention-period 7"
             })
-        
-        return violations
     
-    def _check_storage_encryption(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _check_storage_encryption(
+        self,
+        instance: Dict[str, Any],
+        environment: str,
+        violations: List[Dict[str, Any]]
+    ) -> None:
         """
         Check if storage encryption is enabled for all environments.
         
         REQ-6.2: Validate storage encryption enabled for all RDS instances
         """
-        violations = []
         storage_encrypted = instance.get('storage_encrypted', False)
         
         if not storage_encrypted:
@@ -95,33 +153,44 @@ class ComplianceChecker:
                 'required_value': True,
                 'remediation': "Storage encryption cannot be enabled on existing instances. Create a snapshot, copy it with encryption enabled, and restore from the encrypted snapshot."
             })
-        
-        return violations
     
-    def _check_engine_version(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _check_engine_version(
+        self,
+        instance: Dict[str, Any],
+        environment: str,
+        violations: List[Dict[str, Any]]
+    ) -> None:
         """
         Check database engine version compliance.
         
         REQ-6.3: PostgreSQL must be at (latest - 1) minor version or newer
         Oracle/MS-SQL: Informational only, no violations
         """
-        violations = []
         engine = instance.get('engine', '').lower()
         current_version = instance.get('engine_version', '')
         
         # Only enforce for PostgreSQL
         if engine == 'postgres':
+            region = instance.get('region')
+            compliance_key = (region, engine, current_version)
+            if compliance_key in self._known_compliant:
+                return
+            
             # Get latest available version for this engine
             latest_version = self._get_latest_engine_version(
-                instance.get('region'),
+                region,
                 engine,
                 current_version
             )
             
-            if latest_version and not self._is_version_compliant(current_version, latest_version):
-                # Calculate how many versions behind
-                versions_behind = self._calculate_versions_behind(current_version, latest_version)
-                
+            if not latest_version or current_version == latest_version:
+                compliant, versions_behind = True, 0
+            else:
+                compliant, versions_behind = self._version_status(current_version, latest_version)
+            
+            if compliant:
+                self._known_compliant.add(compliance_key)
+            else:
                 if versions_behind > 2:
                     severity = 'Critical'
                 elif versions_behind > 1:
@@ -140,21 +209,21 @@ class ComplianceChecker:
                 })
         
         # For Oracle and MS-SQL, just log informational data (no violations)
-        elif engine in ['oracle-se2', 'oracle-ee', 'sqlserver-se', 'sqlserver-ee', 'sqlserver-ex', 'sqlserver-web']:
+        elif engine in _INFO_ONLY_ENGINES:
             logger.info(f"{instance['instance_id']}: {engine} version {current_version} (informational only)")
-        
-        return violations
     
-    def _check_multi_az(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _check_multi_az(
+        self,
+        instance: Dict[str, Any],
+        environment: str,
+        violations: List[Dict[str, Any]]
+    ) -> None:
         """
         Check if Multi-AZ is enabled for production instances.
         
         REQ-6.3: Multi-AZ required for production
         """
-        violations = []
         multi_az = instance.get('multi_az', False)
-        tags = instance.get('tags', {})
-        environment = tags.get('Environment', '').lower()
         
         # Only enforce for production
         if environment == 'production' and not multi_az:
@@ -167,23 +236,23 @@ class ComplianceChecker:
                 'required_value': True,
                 'remediation': f"Enable Multi-AZ: aws rds modify-db-instance --db-instance-identifier {instance['instance_id']} --multi-az --apply-immediately"
             })
-        
-        return violations
     
-    def _check_deletion_protection(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _check_deletion_protection(
+        self,
+        instance: Dict[str, Any],
+        environment: str,
+        violations: List[Dict[str, Any]]
+    ) -> None:
         """
         Check if deletion protection is enabled (except POC/Sandbox).
         
         REQ-6.4: Deletion protection required except for POC/Sandbox
         """
-        violations = []
         deletion_protection = instance.get('deletion_protection', False)
-        tags = instance.get('tags', {})
-        environment = tags.get('Environment', '').lower()
         
         # Skip check for POC and Sandbox
-        if environment in ['poc', 'sandbox']:
-            return violations
+        if environment in _POC_SANDBOX_ENVS:
+            return
         
         if not deletion_protection:
             violations.append({
@@ -195,17 +264,18 @@ class ComplianceChecker:
                 'required_value': True,
                 'remediation': f"Enable deletion protection: aws rds modify-db-instance --db-instance-identifier {instance['instance_id']} --deletion-protection --no-apply-immediately"
             })
-        
-        return violations
     
-    def _check_pending_maintenance(self, instance: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _check_pending_maintenance(
+        self,
+        instance: Dict[str, Any],
+        environment: str,
+        violations: List[Dict[str, Any]]
+    ) -> None:
         """
         Check for pending maintenance actions.
         
         REQ-6.4: Alert if maintenance window is within 7 days
         """
-        violations = []
-        
         # Get pending maintenance from RDS API
         pending_maintenance = self._get_pending_maintenance(
             instance.get('region'),
@@ -213,6 +283,8 @@ class ComplianceChecker:
         )
         
         if pending_maintenance:
+            now = datetime.now(timezone.utc)
+            
             # Check if any maintenance is within 7 days
             for maintenance in pending_maintenance:
                 action = maintenance.get('Action', 'Unknown')
@@ -221,8 +293,7 @@ class ComplianceChecker:
                 if auto_applied_date:
                     # Parse date and check if within 7 days
                     try:
-                        maintenance_date = datetime.fromisoformat(auto_applied_date.replace('Z', '+00:00'))
-                        days_until = (maintenance_date - datetime.now(maintenance_date.tzinfo)).days
+                        days_until = (_parse_maintenance_date(auto_applied_date) - now).days
                         
                         if days_until <= 7:
                             violations.append({
@@ -236,8 +307,17 @@ class ComplianceChecker:
                             })
                     except Exception as e:
                         logger.warn(f"Failed to parse maintenance date for {instance['instance_id']}: {str(e)}")
-        
-        return violations
+    
+    # Checks run by check_instance_compliance, in report order: basic checks
+    # (Task 5) then additional checks (Task 5.1)
+    _CHECKS = (
+        _check_backup_retention,
+        _check_storage_encryption,
+        _check_engine_version,
+        _check_multi_az,
+        _check_deletion_protection,
+        _check_pending_maintenance,
+    )
     
     def _get_latest_engine_version(
         self,
@@ -256,11 +336,25 @@ class ComplianceChecker:
         Returns:
             str: Latest available version or None
         """
+        # Get major version from current version (e.g., "15" from "15.4")
+        major_version = (current_version or '').split('.')[0]
+        cache_key = (region, engine, major_version)
+        if cache_key in self._engine_version_cache:
+            return self._engine_version_cache[cache_key]
+        
+        latest_version = self._describe_latest_engine_version(region, engine, major_version)
+        self._engine_version_cache[cache_key] = latest_version
+        return latest_version
+    
+    def _describe_latest_engine_version(
+        self,
+        region: str,
+        engine: str,
+        major_version: str
+    ) -> Optional[str]:
+        """Query RDS for the latest engine version in a major version family."""
         try:
-            rds = self._get_rds_client(region)
-            
-            # Get major version from current version (e.g., "15" from "15.4")
-            major_version = current_version.split('.')[0]
+            rds = _get_rds_client(region)
             
             response = rds.describe_db_engine_versions(
                 Engine=engine,
@@ -280,6 +374,39 @@ class ComplianceChecker:
             logger.warn(f"Failed to get latest engine version for {engine}: {str(e)}")
             return None
     
+    def prefetch_pending_maintenance(self, region: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch pending maintenance actions for every DB instance in a region.
+        
+        Uses one paginated describe call instead of one call per instance.
+        
+        Args:
+            region: AWS region
+            
+        Returns:
+            dict: Pending maintenance action details keyed by DB instance identifier
+        """
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        try:
+            rds = _get_rds_client(region)
+            paginator = rds.get_paginator('describe_pending_maintenance_actions')
+            
+            for page in paginator.paginate():
+                for action in page.get('PendingMaintenanceActions', []):
+                    # e.g. arn:aws:rds:us-east-1:123456789012:db:my-instance
+                    arn_parts = action.get('ResourceIdentifier', '').split(':')
+                    if len(arn_parts) < 7 or arn_parts[5] != 'db':
+                        continue
+                    pending.setdefault(arn_parts[6], []).extend(
+                        action.get('PendingMaintenanceActionDetails', [])
+                    )
+            
+        except Exception as e:
+            logger.warn(f"Failed to get pending maintenance for region {region}: {str(e)}")
+        
+        self._pending_cache[region] = pending
+        return pending
+    
     def _get_pending_maintenance(
         self,
         region: str,
@@ -295,77 +422,40 @@ class ComplianceChecker:
         Returns:
             list: Pending maintenance actions
         """
-        try:
-            rds = self._get_rds_client(region)
-            
-            response = rds.describe_pending_maintenance_actions(
-                Filters=[
-                    {
-                        'Name': 'db-instance-id',
-                        'Values': [instance_id]
-                    }
-                ]
-            )
-            
-            actions = response.get('PendingMaintenanceActions', [])
-            if actions:
-                return actions[0].get('PendingMaintenanceActionDetails', [])
-            
-            return []
-            
-        except Exception as e:
-            logger.warn(f"Failed to get pending maintenance for {instance_id}: {str(e)}")
-            return []
+        pending = self._pending_cache.get(region)
+        if pending is None:
+            pending = self.prefetch_pending_maintenance(region)
+        return pending.get(instance_id, [])
     
-    def _get_rds_client(self, region: str):
-        """Get or create RDS client for region."""
-        if region not in self.rds_clients:
-            self.rds_clients[region] = AWSClients.get_rds_client(region)
-        return self.rds_clients[region]
-    
-    def _is_version_compliant(self, current: str, latest: str) -> bool:
+    def _version_status(self, current: str, latest: str) -> Tuple[bool, int]:
         """
-        Check if current version is compliant (within 1 minor version of latest).
+        Compare current against latest, parsing each version once.
+        
+        Compliant means same major version and within 1 minor version of latest.
         
         Args:
             current: Current version (e.g., "15.4")
             latest: Latest version (e.g., "15.5")
             
         Returns:
-            bool: True if compliant
+            tuple: (compliant, minor versions behind)
         """
         try:
-            current_parts = [int(x) for x in current.split('.')]
-            latest_parts = [int(x) for x in latest.split('.')]
-            
-            # Same major version
-            if current_parts[0] != latest_parts[0]:
-                return False
-            
-            # Within 1 minor version
-            minor_diff = latest_parts[1] - current_parts[1]
-            return minor_diff <= 1
-            
-        except Exception as e:
+            current_parts = _parse_version(current)
+            latest_parts = _parse_version(latest)
+        except (ValueError, AttributeError) as e:
             logger.warn(f"Failed to compare versions {current} and {latest}: {str(e)}")
-            return True  # Assume compliant if we can't parse
-    
-    def _calculate_versions_behind(self, current: str, latest: str) -> int:
-        """
-        Calculate how many minor versions behind current is from latest.
+            return True, 0  # Assume compliant if we can't parse
         
-        Args:
-            current: Current version
-            latest: Latest version
-            
-        Returns:
-            int: Number of versions behind
-        """
         try:
-            current_parts = [int(x) for x in current.split('.')]
-            latest_parts = [int(x) for x in latest.split('.')]
-            
-            return latest_parts[1] - current_parts[1]
-            
-        except Exception:
-            return 0
+            minor_diff = latest_parts[1] - current_parts[1]
+        except IndexError:
+            # Major-only version strings carry no minor part to compare
+            if current_parts[0] != latest_parts[0]:
+                return False, 0
+            logger.warn(f"Failed to compare versions {current} and {latest}: missing minor version")
+            return True, 0
+        
+        # Same major version, within 1 minor version
+        compliant = current_parts[0] == latest_parts[0] and minor_diff <= 1
+        return compliant, minor_diff
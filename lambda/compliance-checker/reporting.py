@@ -5,11 +5,20 @@ Compliance Reporter
 Generates compliance reports and saves them to S3.
 """
 
+import gzip
+import io
 import os
 import sys
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Any
+from boto3.s3.transfer import TransferConfig
+
+# orjson is optional; fall back to the stdlib json module when not packaged
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from shared.logger import get_logger
@@ -17,6 +26,26 @@ from shared.aws_clients import AWSClients
 
 logger = get_logger(__name__)
 
+# Reports above the threshold upload as parallel multipart chunks
+REPORT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+
+def _dump_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a report as indented UTF-8 JSON."""
+    if orjson:
+        # Datetimes go through default=str, as with json.dumps
+        return orjson.dumps(
+            report,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(report, indent=2, default=str).encode('utf-8')
+
 
 class ComplianceReporter:
     """Generate and save compliance reports."""
@@ -48,35 +77,34 @@ class ComplianceReporter:
         Returns:
             dict: Complete compliance report
         """
-        report_date = datetime.utcnow().strftime('%Y-%m-%d')
+        # Read the clock once so the report date and timestamp always agree
+        now = datetime.now(timezone.utc)
+        report_date = now.strftime('%Y-%m-%d')
         
-        # Group violations by severity
-        violations_by_severity = {
-            'critical': [v for v in violations if v['severity'] == 'Critical'],
-            'high': [v for v in violations if v['severity'] == 'High'],
-            'medium': [v for v in violations if v['severity'] == 'Medium'],
-            'low': [v for v in violations if v['severity'] == 'Low']
+        # Group violations by severity, as positions in detailed_violations so
+        # each violation is written to the report once, and count them by check
+        # type and by instance, in a single pass
+        violations_by_severity = {'critical': [], 'high': [], 'medium': [], 'low': []}
+        severity_buckets = {
+            'Critical': violations_by_severity['critical'],
+            'High': violations_by_severity['high'],
+            'Medium': violations_by_severity['medium'],
+            'Low': violations_by_severity['low']
         }
-        
-        # Group violations by check type
         violations_by_type = {}
-        for v in violations:
-            check_type = v['check_type']
-            if check_type not in violations_by_type:
-                violations_by_type[check_type] = []
-            violations_by_type[check_type].append(v)
-        
-        # Group violations by instance
         violations_by_instance = {}
-        for v in violations:
+        for index, v in enumerate(violations):
+            bucket = severity_buckets.get(v['severity'])
+            if bucket is not None:
+                bucket.append(index)
+            check_type = v['check_type']
+            violations_by_type[check_type] = violations_by_type.get(check_type, 0) + 1
             instance_id = v['instance_id']
-            if instance_id not in violations_by_instance:
-                violations_by_instance[instance_id] = []
-            violations_by_instance[instance_id].append(v)
+            violations_by_instance[instance_id] = violations_by_instance.get(instance_id, 0) + 1
         
         report = {
             'report_date': report_date,
-            'generated_at': datetime.utcnow().isoformat() + 'Z',
+            'generated_at': now.isoformat().replace('+00:00', 'Z'),
             'summary': {
                 'total_instances': len(instances),
                 'compliant_instances': compliant_count,
@@ -94,12 +122,8 @@ class ComplianceReporter:
                 'medium': violations_by_severity['medium'],
                 'low': violations_by_severity['low']
             },
-            'violations_by_type': {
-                k: len(v) for k, v in violations_by_type.items()
-            },
-            'violations_by_instance': {
-                k: len(v) for k, v in violations_by_instance.items()
-            },
+            'violations_by_type': violations_by_type,
+            'violations_by_instance': violations_by_instance,
             'detailed_violations': violations,
             'remediation_summary': self._generate_remediation_summary(violations)
         }
@@ -122,23 +146,29 @@ class ComplianceReporter:
         report_date = report['report_date']
         year, month, day = report_date.split('-')
         
-        # S3 key: compliance-reports/YYYY/MM/compliance_report_YYYY-MM-DD.json
-        s3_key = f"compliance-reports/{year}/{month}/compliance_report_{report_date}.json"
+        # S3 key: compliance-reports/YYYY/MM/compliance_report_YYYY-MM-DD.json.gz
+        s3_key = f"compliance-reports/{year}/{month}/compliance_report_{report_date}.json.gz"
         
         try:
-            report_json = json.dumps(report, indent=2, default=str)
+            # Reports repeat the same check types, severities and remediation
+            # text, so they compress well
+            report_body = gzip.compress(_dump_report(report), compresslevel=6)
             
-            self.s3.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=report_json.encode('utf-8'),
-                ContentType='application/json',
-                ServerSideEncryption='AES256',
-                Metadata={
-                    'report-date': report_date,
-                    'generated-by': 'compliance-checker',
-                    'version': '1.0.0'
-                }
+            self.s3.upload_fileobj(
+                io.BytesIO(report_body),
+                bucket_name,
+                s3_key,
+                ExtraArgs={
+                    'ContentType': 'application/json',
+                    'ContentEncoding': 'gzip',
+                    'ServerSideEncryption': 'AES256',
+                    'Metadata': {
+                        'report-date': report_date,
+                        'generated-by': 'compliance-checker',
+                        'version': '1.0.0'
+                    }
+                },
+                Config=REPORT_TRANSFER_CONFIG
             )
             
             logger.info(f"Saved compliance report to s3://{bucket_name}/{s3_key}")
@@ -158,16 +188,12 @@ class ComplianceReporter:
         Returns:
             dict: Remediation actions grouped by check type
         """
+        # Remediations per check type, in first-seen order (dict keys as an
+        # ordered set, so the report is stable across runs)
         remediation_by_type = {}
         
         for violation in violations:
-            check_type = violation['check_type']
             remediation = violation.get('remediation', 'No remediation available')
-            
-            if check_type not in remediation_by_type:
-                remediation_by_type[check_type] = set()
-            
-            remediation_by_type[check_type].add(remediation)
+            remediation_by_type.setdefault(violation['check_type'], {})[remediation] = None
         
-        # Convert sets to lists
         return {k: list(v) for k, v in remediation_by_type.items()}
@@ -10,7 +10,7 @@ import os
 import sys
 import json
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import boto3
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -86,19 +86,46 @@ class RDSPricingCalculator:
         """
         self.config = config
         self.hours_per_month = 730  # Average hours per month
+        
+        # Monthly compute cost per region as (cost by instance class, cost for
+        # unknown classes), evaluated once from PRICING_DATA; regions without
+        # a multiplier use the 1.0 baseline table
+        self._base_compute_monthly = self._build_compute_monthly(1.0)
+        self._compute_monthly = {
+            region: self._build_compute_monthly(multiplier)
+            for region, multiplier in self.PRICING_DATA['regional_multiplier'].items()
+        }
+        
+        # Cost components by instance shape; a fleet shares a handful of
+        # shapes, and right-sizing prices the same candidate classes repeatedly
+        self._cost_cache: Dict[Tuple, Tuple[float, float, float, float, float]] = {}
+    
+    def _build_compute_monthly(self, regional_multiplier: float) -> Tuple[Dict[str, float], float]:
+        """Build the monthly compute cost table for one regional multiplier."""
+        compute_table = {
+            instance_class: compute_hourly * self.hours_per_month * regional_multiplier
+            for instance_class, compute_hourly in self.PRICING_DATA['compute'].items()
+        }
+        return compute_table, 0.10 * self.hours_per_month * regional_multiplier
     
-    def calculate_instance_cost(self, instance: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_instance_cost(
+        self,
+        instance: Dict[str, Any],
+        *,
+        instance_class_override: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Calculate monthly cost for an RDS instance.
         
         Args:
             instance: RDS instance data from inventory
+            instance_class_override: Price as this instance class instead of the instance's own
             
         Returns:
             dict: Cost breakdown with monthly total
         """
         instance_id = instance.get('instance_id', 'unknown')
-        instance_class = instance.get('instance_class', 'db.t3.micro')
+        instance_class = instance_class_override or instance.get('instance_class', 'db.t3.micro')
         storage_type = instance.get('storage_type', 'gp2')
         allocated_storage = instance.get('allocated_storage', 100)
         iops = instance.get('iops', 0)
@@ -107,12 +134,74 @@ class RDSPricingCalculator:
         engine = instance.get('engine', 'postgres')
         backup_retention = instance.get('backup_retention_period', 7)
         
+        compute_monthly, storage_monthly, iops_monthly, backup_monthly, regional_multiplier = (
+            self._get_cost_components(
+                instance_class,
+                storage_type,
+                allocated_storage,
+                iops,
+                multi_az,
+                region,
+                backup_retention
+            )
+        )
+        
+        # Total monthly cost
+        monthly_cost = compute_monthly + storage_monthly + iops_monthly + backup_monthly
+        
+        cost_data = {
+            'instance_id': instance_id,
+            'account_id': instance.get('account_id', 'unknown'),
+            'region': region,
+            'engine': engine,
+            'instance_class': instance_class,
+            'storage_type': storage_type,
+            'allocated_storage': allocated_storage,
+            'multi_az': multi_az,
+            'monthly_cost': round(monthly_cost, 2),
+            'cost_breakdown': {
+                'compute': round(compute_monthly, 2),
+                'storage': round(storage_monthly, 2),
+                'iops': round(iops_monthly, 2),
+                'backup': round(backup_monthly, 2)
+            },
+            'regional_multiplier': regional_multiplier,
+            'calculated_at': instance.get('last_discovered', '')
+        }
+        
+        logger.debug(f"Calculated cost for {instance_id}: ${monthly_cost:.2f}/month")
+        
+        return cost_data
+    
+    def _get_cost_components(
+        self,
+        instance_class: str,
+        storage_type: str,
+        allocated_storage: int,
+        iops: int,
+        multi_az: bool,
+        region: str,
+        backup_retention: int
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Get unrounded monthly cost components for an instance shape.
+        
+        Results are cached per shape, since PRICING_DATA does not change at runtime.
+        
+        Returns:
+            tuple: (compute, storage, iops, backup, regional_multiplier)
+        """
+        cache_key = (instance_class, storage_type, allocated_storage, iops, multi_az, region, backup_retention)
+        components = self._cost_cache.get(cache_key)
+        if components is not None:
+            return components
+        
         # Get regional multiplier
         regional_multiplier = self.PRICING_DATA['regional_multiplier'].get(region, 1.0)
         
         # Calculate compute cost
-        compute_hourly = self.PRICING_DATA['compute'].get(instance_class, 0.10)
-        compute_monthly = compute_hourly * self.hours_per_month * regional_multiplier
+        compute_table, default_compute = self._compute_monthly.get(region, self._base_compute_monthly)
+        compute_monthly = compute_table.get(instance_class, default_compute)
         
         # Apply Multi-AZ multiplier to compute
         if multi_az:
@@ -138,32 +227,9 @@ class RDSPricingCalculator:
         backup_storage_gb = allocated_storage * max(0, backup_retention - 1) / 7
         backup_monthly = backup_storage_gb * self.PRICING_DATA['backup'] * regional_multiplier
         
-        # Total monthly cost
-        monthly_cost = compute_monthly + storage_monthly + iops_monthly + backup_monthly
-        
-        cost_data = {
-            'instance_id': instance_id,
-            'account_id': instance.get('account_id', 'unknown'),
-            'region': region,
-            'engine': engine,
-            'instance_class': instance_class,
-            'storage_type': storage_type,
-            'allocated_storage': allocated_storage,
-            'multi_az': multi_az,
-            'monthly_cost': round(monthly_cost, 2),
-            'cost_breakdown': {
-                'compute': round(compute_monthly, 2),
-                'storage': round(storage_monthly, 2),
-                'iops': round(iops_monthly, 2),
-                'backup': round(backup_monthly, 2)
-            },
-            'regional_multiplier': regional_multiplier,
-            'calculated_at': instance.get('last_discovered', '')
-        }
-        
-        logger.debug(f"Calculated cost for {instance_id}: ${monthly_cost:.2f}/month")
-        
-        return cost_data
+        components = (compute_monthly, storage_monthly, iops_monthly, backup_monthly, regional_multiplier)
+        self._cost_cache[cache_key] = components
+        return components
     
     def get_reserved_instance_pricing(
         self,
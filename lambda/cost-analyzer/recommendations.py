@@ -29,6 +29,13 @@ class RecommendationEngine:
         'm5': ['db.m5.large', 'db.m5.xlarge', 'db.m5.2xlarge', 'db.m5.4xlarge', 'db.m5.8xlarge'],
     }
     
+    # Instance class -> (its family's classes, position within the family)
+    CLASS_TO_FAMILY_INDEX = {
+        instance_class: (family_classes, index)
+        for family_classes in INSTANCE_FAMILIES.values()
+        for index, instance_class in enumerate(family_classes)
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize recommendation engine.
@@ -128,9 +135,10 @@ class RecommendationEngine:
             return None
         
         # Calculate cost savings
-        target_instance = instance.copy()
-        target_instance['instance_class'] = target_class
-        target_cost_data = self.pricing_calculator.calculate_instance_cost(target_instance)
+        target_cost_data = self.pricing_calculator.calculate_instance_cost(
+            instance,
+            instance_class_override=target_class
+        )
         target_cost = target_cost_data['monthly_cost']
         
         savings = current_cost - target_cost
@@ -175,16 +183,12 @@ class RecommendationEngine:
         Returns:
             str: Suggested instance class, or None
         """
-        # Determine instance family
-        family = current_class.split('.')[1] if '.' in current_class else None
-        if not family or family not in self.INSTANCE_FAMILIES:
+        # Determine instance family and size position
+        entry = self.CLASS_TO_FAMILY_INDEX.get(current_class)
+        if entry is None:
             return None
         
-        family_classes = self.INSTANCE_FAMILIES[family]
-        current_index = family_classes.index(current_class) if current_class in family_classes else -1
-        
-        if current_index == -1:
-            return None
+        family_classes, current_index = entry
         
         # If underutilized, suggest one size smaller
         if utilization['is_underutilized'] and current_index > 0:
@@ -238,11 +242,13 @@ class RecommendationEngine:
         Returns:
             bool: True if RI should be recommended
         """
-        # Recommend RI for production instances with good utilization
-        is_production = instance.get('tags', {}).get('Environment', '').lower() == 'production'
-        is_well_utilized = utilization['utilization_score'] > 50
+        # Recommend RI for production instances with good utilization; the
+        # score is checked first so most instances skip the tag lookup
+        if utilization['utilization_score'] <= 50:
+            return False
         
-        return is_production and is_well_utilized
+        environment = (instance.get('tags') or {}).get('Environment') or ''
+        return environment.lower() == 'production'
     
     def _generate_reserved_instance_recommendation(
         self,
@@ -28,7 +28,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# AWS SDK configuration with retry logic
+# AWS SDK configuration with retry logic. TCP keepalive keeps pooled
+# connections alive while a warm container is idle between invocations,
+# so later calls reuse them instead of paying a new TLS handshake
 BOTO_CONFIG = Config(
     retries={
         'max_attempts': 3,
@@ -36,9 +38,20 @@ BOTO_CONFIG = Config(
     },
     connect_timeout=5,
     read_timeout=30,
-    max_pool_connections=50
+    max_pool_connections=50,
+    tcp_keepalive=True
 )
 
+# DynamoDB writes get a deeper retry budget so partition throttling
+# (ProvisionedThroughputExceeded, ThrottlingException) is absorbed by the
+# SDK instead of surfacing to callers
+DYNAMODB_BOTO_CONFIG = BOTO_CONFIG.merge(Config(
+    retries={
+        'max_attempts': 10,
+        'mode': 'adaptive'
+    }
+))
+
 # Cache for assumed role sessions
 _session_cache: Dict[str, boto3.Session] = {}
 
@@ -201,7 +214,7 @@ class AWSClients:
             boto3.resource: DynamoDB resource
         """
         region = region or os.environ.get('AWS_REGION', 'ap-southeast-1')
-        return boto3.resource('dynamodb', region_name=region, config=BOTO_CONFIG)
+        return boto3.resource('dynamodb', region_name=region, config=DYNAMODB_BOTO_CONFIG)
     
     @staticmethod
     def get_dynamodb_client(region: Optional[str] = None) -> boto3.client:
@@ -215,7 +228,7 @@ class AWSClients:
             boto3.client: DynamoDB client
         """
         region = region or os.environ.get('AWS_REGION', 'ap-southeast-1')
-        return boto3.client('dynamodb', region_name=region, config=BOTO_CONFIG)
+        return boto3.client('dynamodb', region_name=region, config=DYNAMODB_BOTO_CONFIG)
     
     @staticmethod
     def get_s3_client(region: Optional[str] = None) -> boto3.client:
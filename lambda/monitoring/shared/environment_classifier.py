@@ -6,13 +6,24 @@ Determines environment type using multiple methods with fallback priority.
 Supports AWS tags, manual mappings, account-based, and naming patterns.
 """
 
+import logging
 import re
-from typing import Dict, Any, Optional
+import sys
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Kinds of compiled naming pattern, compared by identity in the match loop
+_REGEX = 'regex'
+_SUBSTRING = 'substring'
 
 
 class EnvironmentClassifier:
     """Classify RDS instances into environments using multiple methods."""
     
+    # Tag keys recognised in any letter case when no configured tag name matches
+    _ENV_KEYWORDS = frozenset({'environment', 'env', 'environ', 'stage'})
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize classifier with configuration.
@@ -40,6 +51,42 @@ class EnvironmentClassifier:
             'stage',
             'STAGE'
         ])
+        
+        # Environment labels lowercased and interned once, so every result
+        # shares one string object per label
+        self._instance_envs = {
+            key: sys.intern(value.lower()) for key, value in self.instance_mappings.items()
+        }
+        self._account_envs = {
+            key: sys.intern(value.lower()) for key, value in self.account_mappings.items()
+        }
+        self._default_env = sys.intern(self.default_environment.lower())
+        
+        # Naming patterns compiled once as [(environment, [(kind, matcher)])], where
+        # kind is _REGEX for a compiled regex or _SUBSTRING for a lowercase
+        # substring used when the pattern is not a valid regex
+        self._compiled_patterns = []
+        for environment, patterns in self.naming_patterns.items():
+            compiled_patterns = []
+            self._compiled_patterns.append((sys.intern(environment.lower()), compiled_patterns))
+            for pattern in patterns:
+                try:
+                    compiled_patterns.append((_REGEX, re.compile(pattern, re.IGNORECASE)))
+                except re.error as e:
+                    logger.warning(
+                        f"Naming pattern {pattern!r} for {environment} is not a valid regex "
+                        f"({e}); matching it as a plain substring"
+                    )
+                    compiled_patterns.append((_SUBSTRING, pattern.lower()))
+        
+        # Last classification as (instance_id, account_id, tags, result); callers
+        # usually ask for the environment and then its source for the same
+        # instance, so the second call reuses the first one's work
+        self._last_classification: Optional[Tuple[Any, Any, Dict[str, str], Tuple[str, str]]] = None
+    
+    def clear_cache(self) -> None:
+        """Forget the remembered classification."""
+        self._last_classification = None
     
     def get_environment(self, instance: Dict[str, Any]) -> str:
         """
@@ -58,55 +105,93 @@ class EnvironmentClassifier:
         Returns:
             str: Environment type (lowercase)
         """
+        return self._get_classification(instance)[0]
+    
+    def get_classification_source(self, instance: Dict[str, Any]) -> str:
+        """
+        Identify which method was used to classify the instance.
+        
+        Args:
+            instance: RDS instance metadata
+            
+        Returns:
+            str: Classification source
+        """
+        return self._get_classification(instance)[1]
+    
+    def classify_many(self, instances: Iterable[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+        """
+        Classify a batch of instances in one pass.
+        
+        Args:
+            instances: RDS instance metadata records
+            
+        Returns:
+            tuple: (environments, sources) as two lists aligned with the input order
+        """
+        environments: List[str] = []
+        sources: List[str] = []
+        add_environment = environments.append
+        add_source = sources.append
+        classify = self._classify
+        
+        for instance in instances:
+            environment, source = classify(
+                instance.get('instance_id', ''),
+                instance.get('account_id', ''),
+                instance.get('tags', {})
+            )
+            add_environment(environment)
+            add_source(source)
+        
+        return environments, sources
+    
+    def _get_classification(self, instance: Dict[str, Any]) -> Tuple[str, str]:
+        """Return (environment, source), reusing the last result if the inputs are unchanged."""
         instance_id = instance.get('instance_id', '')
         account_id = instance.get('account_id', '')
         tags = instance.get('tags', {})
         
+        last = self._last_classification
+        if last is not None and last[0] == instance_id and last[1] == account_id and last[2] == tags:
+            return last[3]
+        
+        result = self._classify(instance_id, account_id, tags)
+        self._last_classification = (instance_id, account_id, dict(tags), result)
+        return result
+    
+    def _classify(self, instance_id: str, account_id: str, tags: Dict[str, str]) -> Tuple[str, str]:
+        """
+        Classify an instance in a single pass.
+        
+        Args:
+            instance_id: RDS instance identifier
+            account_id: AWS account ID
+            tags: Dictionary of AWS tags
+            
+        Returns:
+            tuple: (environment (lowercase), classification source)
+        """
         # Priority 1: AWS Tags (flexible tag names)
         env_value = self._get_environment_from_tags(tags)
         if env_value:
-            return env_value.lower()
+            return sys.intern(env_value.lower()), 'aws_tag'
         
         # Priority 2: Manual instance mapping
-        if instance_id in self.instance_mappings:
-            return self.instance_mappings[instance_id].lower()
+        if instance_id in self._instance_envs:
+            return self._instance_envs[instance_id], 'manual_mapping'
         
         # Priority 3: Account-based classification
-        if account_id in self.account_mappings:
-            return self.account_mappings[account_id].lower()
+        if account_id in self._account_envs:
+            return self._account_envs[account_id], 'account_mapping'
         
         # Priority 4: Naming pattern matching
         pattern_env = self._match_naming_pattern(instance_id)
         if pattern_env:
-            return pattern_env.lower()
+            return pattern_env, 'naming_pattern'
         
         # Priority 5: Default
-        return self.default_environment.lower()
-    
-    def get_classification_source(self, instance: Dict[str, Any]) -> str:
-        """
-        Identify which method was used to classify the instance.
-        
-        Args:
-            instance: RDS instance metadata
-            
-        Returns:
-            str: Classification source
-        """
-        instance_id = instance.get('instance_id', '')
-        account_id = instance.get('account_id', '')
-        tags = instance.get('tags', {})
-        
-        if self._get_environment_from_tags(tags):
-            return 'aws_tag'
-        elif instance_id in self.instance_mappings:
-            return 'manual_mapping'
-        elif account_id in self.account_mappings:
-            return 'account_mapping'
-        elif self._match_naming_pattern(instance_id):
-            return 'naming_pattern'
-        else:
-            return 'default'
+        return self._default_env, 'default'
     
     def _match_naming_pattern(self, instance_id: str) -> Optional[str]:
         """
@@ -116,17 +201,19 @@ class EnvironmentClassifier:
             instance_id: RDS instance identifier
             
         Returns:
-            str: Matched environment or None
+            str: Matched environment (lowercase) or None
         """
-        for environment, patterns in self.naming_patterns.items():
-            for pattern in patterns:
-                # Try as regex pattern
-                try:
-                    if re.search(pattern, instance_id, re.IGNORECASE):
+        instance_id_lower = None
+        for environment, patterns in self._compiled_patterns:
+            for kind, matcher in patterns:
+                if kind is _REGEX:
+                    if matcher.search(instance_id):
                         return environment
-                except re.error:
-                    # If regex fails, try as simple string match
-                    if pattern.lower() in instance_id.lower():
+                else:
+                    # Invalid regex, so use a simple string match
+                    if instance_id_lower is None:
+                        instance_id_lower = instance_id.lower()
+                    if matcher in instance_id_lower:
                         return environment
         
         return None
@@ -146,14 +233,18 @@ class EnvironmentClassifier:
         Returns:
             str: Environment value or None if not found
         """
+        if not tags:
+            return None
+        
         # Try each possible environment tag name
         for tag_name in self.environment_tag_names:
-            if tag_name in tags and tags[tag_name]:
-                return tags[tag_name]
+            tag_value = tags.get(tag_name)
+            if tag_value:
+                return tag_value
         
         # Also try case-insensitive matching for any tag that might be environment-related
         for tag_key, tag_value in tags.items():
-            if tag_key.lower() in ['environment', 'env', 'environ', 'stage'] and tag_value:
+            if tag_value and tag_key.lower() in self._ENV_KEYWORDS:
                 return tag_value
         
         return None
@@ -19,44 +19,329 @@ Metadata:
 """
 
 from typing import Dict, Any, Optional, Callable
-from datetime import datetime
-from functools import wraps
+from collections import deque
+from functools import lru_cache, wraps
 import json
+import os
+import re
+import sys
+import time
 import traceback
 
+# Base classes of the AWS SDK exceptions that categorize_aws_error understands
+try:
+    from boto3.exceptions import Boto3Error
+    from botocore.exceptions import BotoCoreError, ClientError
+    _AWS_ERROR_BASES = (BotoCoreError, ClientError, Boto3Error)
+except ImportError:
+    _AWS_ERROR_BASES = ()
+
+# Capture tracebacks for client (4xx) errors too, not only server errors
+TRACE_ALL_ERRORS = os.environ.get('TRACE_ALL_ERRORS', 'false').lower() == 'true'
+
+# Include remediation steps in 4xx error responses (always included for 5xx)
+INCLUDE_REMEDIATION = os.environ.get('INCLUDE_REMEDIATION', 'true').lower() == 'true'
+
+# Deepest stack captured in error logs
+TRACEBACK_LIMIT = 20
+
+# orjson is optional; fall back to the stdlib json module when not packaged
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string; values JSON cannot represent become strings."""
+    if orjson:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
+
+# (epoch second, formatted 'YYYY-MM-DDTHH:MM:SS') of the last timestamp issued
+_timestamp_cache = (None, '')
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO 8601 string with microseconds and a 'Z' suffix.
+    
+    Equivalent to datetime.utcnow().isoformat() + 'Z' but without building a
+    datetime; the date/time prefix is only reformatted when the second changes.
+    """
+    global _timestamp_cache
+    now = time.time()
+    secs = int(now)
+    cached_secs, prefix = _timestamp_cache
+    if secs != cached_secs:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))
+        _timestamp_cache = (secs, prefix)
+    return f"{prefix}.{int((now - secs) * 1e6):06d}Z"
+
 
 class ActionableError:
     """
     Represents an error with context and remediation steps.
     """
     
+    # Many of these can be built during a fanned-out discovery run
+    __slots__ = (
+        'error_type', 'error_message', 'context', 'severity', 'timestamp',
+        '_remediation', '_remediation_factory'
+    )
+    
     def __init__(
         self,
         error_type: str,
         error_message: str,
         context: Dict[str, Any],
         severity: str = "warning",
-        remediation: Optional[Dict[str, Any]] = None
+        remediation: Optional[Dict[str, Any]] = None,
+        remediation_factory: Optional[Callable[[], Dict[str, Any]]] = None
     ):
+        """
+        Args:
+            remediation: Remediation details, if already built
+            remediation_factory: Builds the remediation details on first access
+                instead; used when they may never be rendered
+        """
         self.error_type = error_type
         self.error_message = error_message
         self.context = context
         self.severity = severity  # info, warning, error, critical
-        self.remediation = remediation or {}
-        self.timestamp = datetime.utcnow().isoformat() + 'Z'
+        self._remediation = remediation
+        self._remediation_factory = remediation_factory
+        self.timestamp = _utc_timestamp()
+    
+    @property
+    def remediation(self) -> Dict[str, Any]:
+        """Remediation details, built by the factory on first access."""
+        if self._remediation is None:
+            factory = self._remediation_factory
+            self._remediation = (factory() if factory else None) or {}
+            self._remediation_factory = None
+        return self._remediation
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+    @remediation.setter
+    def remediation(self, value: Optional[Dict[str, Any]]):
+        self._remediation = value or {}
+        self._remediation_factory = None
+    
+    def to_dict(self, include_remediation: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Args:
+            include_remediation: When False, remediation is left empty and
+                never built
+        """
         return {
             'error_type': self.error_type,
             'error_message': self.error_message,
             'context': self.context,
             'severity': self.severity,
-            'remediation': self.remediation,
+            'remediation': self.remediation if include_remediation else {},
             'timestamp': self.timestamp
         }
 
 
+# Remediation skeletons, built once at import. Only the fields that mention
+# the failing account, region or role are filled in per call; the static
+# action steps are shared by every ActionableError built from them.
+_CROSS_ACCOUNT_REMEDIATION = {
+    'title': "Cross-Account Role Not Configured",
+    'description': "The dashboard cannot discover RDS instances in account {account_id} because the cross-account IAM role is not set up.",
+    'impact': "RDS instances in this account will not be visible in the dashboard.",
+    'required_actions': None,
+    'documentation_link': "/docs/cross-account-setup.md",
+    'can_skip': True,
+    'skip_reason': "Discovery will continue in other configured accounts and regions."
+}
+_CROSS_ACCOUNT_CREATE_ROLE = "Create IAM role '{role_name}' in account {account_id}"
+_CROSS_ACCOUNT_STATIC_STEPS = (
+    {
+        'step': 2,
+        'action': "Configure trust relationship",
+        'details': "Allow the dashboard Lambda role to assume this role with the configured external ID."
+    },
+    {
+        'step': 3,
+        'action': "Attach required permissions",
+        'details': "Grant rds:Describe*, cloudwatch:GetMetricStatistics, and tag:GetResources permissions."
+    }
+)
+
+_REGION_NOT_ENABLED_REMEDIATION = {
+    'title': "AWS Region Not Enabled",
+    'description': "Region {region} is not enabled in account {account_id}. This is normal if you don't use this region.",
+    'impact': "No RDS instances will be discovered in this region.",
+    'required_actions': None,
+    'can_skip': True,
+    'skip_reason': "Discovery will continue in other enabled regions."
+}
+_REGION_ENABLE_DETAILS = "Go to AWS Console → Account Settings → Enable {region}"
+_REGION_EXCLUDE_DETAILS = "Update TARGET_REGIONS environment variable to exclude {region}"
+
+_INSUFFICIENT_PERMISSIONS_REMEDIATION = {
+    'title': "Insufficient IAM Permissions",
+    'description': "The dashboard Lambda role does not have all required permissions.",
+    'impact': "Cannot discover or monitor RDS instances properly.",
+    'required_actions': None,
+    'documentation_link': "/docs/iam-permissions.md",
+    'can_skip': False,
+    'skip_reason': None
+}
+_INSUFFICIENT_PERMISSIONS_STATIC_STEPS = (
+    {
+        'step': 2,
+        'action': "Verify policy attachment",
+        'details': "Ensure the policy is attached to the Lambda execution role."
+    },
+    {
+        'step': 3,
+        'action': "Wait for propagation",
+        'details': "IAM changes may take up to 60 seconds to propagate."
+    }
+)
+
+_NO_INSTANCES_REMEDIATION = {
+    'title': "No RDS Instances Discovered",
+    'description': "No RDS instances were found in {region}. This is normal if you don't have RDS instances in this region.",
+    'impact': "No impact - this is informational only.",
+    'required_actions': None,
+    'can_skip': True,
+    'skip_reason': "This is informational - no action needed if you don't use RDS in this region."
+}
+_NO_INSTANCES_VERIFY_DETAILS = "Check AWS Console → RDS → {region} to confirm instances exist."
+_NO_INSTANCES_FILTER_STEP = {
+    'step': 2,
+    'action': "Check filters (if applicable)",
+    'details': "Ensure no tag-based filters are excluding your instances."
+}
+
+_GENERIC_REMEDIATION = {
+    'title': None,
+    'description': None,
+    'impact': "Discovery may be incomplete for this account/region.",
+    'required_actions': [
+        {
+            'step': 1,
+            'action': "Check CloudWatch Logs",
+            'details': "Review Lambda logs for detailed error information."
+        },
+        {
+            'step': 2,
+            'action': "Verify AWS service status",
+            'details': "Check https://status.aws.amazon.com/ for service issues."
+        },
+        {
+            'step': 3,
+            'action': "Retry discovery",
+            'details': "Manually trigger discovery again or wait for next scheduled run."
+        }
+    ],
+    'can_skip': True,
+    'skip_reason': "Discovery will continue in other accounts/regions."
+}
+
+# Throttling remediation has no per-call fields at all
+_THROTTLING_REMEDIATION = {
+    'title': "AWS API Rate Limit Exceeded",
+    'description': "Too many API calls to AWS services. This is temporary.",
+    'impact': "Discovery may be delayed but will retry automatically.",
+    'required_actions': [
+        {
+            'step': 1,
+            'action': "Wait and retry",
+            'details': "AWS will automatically allow requests after the rate limit window passes."
+        },
+        {
+            'step': 2,
+            'action': "Consider request throttling",
+            'details': "If this happens frequently, contact AWS support to increase limits."
+        }
+    ],
+    'can_skip': True,
+    'skip_reason': "Discovery will retry automatically on next scheduled run."
+}
+
+
+# Remediation builders for the catalog errors. Results are memoized per
+# argument tuple: retries and throttling storms keep failing for the same
+# account/region pair, and every such error can share one remediation dict.
+# The dicts are shared, so treat them as read-only.
+
+@lru_cache(maxsize=256)
+def _cross_account_remediation(account_id: str, role_name: str) -> Dict[str, Any]:
+    tmpl = _CROSS_ACCOUNT_REMEDIATION
+    return {
+        **tmpl,
+        'description': tmpl['description'].format(account_id=account_id),
+        'required_actions': [
+            {
+                'step': 1,
+                'action': _CROSS_ACCOUNT_CREATE_ROLE.format(role_name=role_name, account_id=account_id),
+                'details': "This role allows the dashboard to read RDS instance information."
+            },
+            *_CROSS_ACCOUNT_STATIC_STEPS
+        ]
+    }
+
+
+@lru_cache(maxsize=256)
+def _region_not_enabled_remediation(account_id: str, region: str) -> Dict[str, Any]:
+    tmpl = _REGION_NOT_ENABLED_REMEDIATION
+    return {
+        **tmpl,
+        'description': tmpl['description'].format(region=region, account_id=account_id),
+        'required_actions': [
+            {
+                'step': 1,
+                'action': "Enable the region (optional)",
+                'details': _REGION_ENABLE_DETAILS.format(region=region)
+            },
+            {
+                'step': 2,
+                'action': "Or remove from configuration",
+                'details': _REGION_EXCLUDE_DETAILS.format(region=region)
+            }
+        ]
+    }
+
+
+@lru_cache(maxsize=256)
+def _insufficient_permissions_remediation(missing_permissions: tuple) -> Dict[str, Any]:
+    return {
+        **_INSUFFICIENT_PERMISSIONS_REMEDIATION,
+        'required_actions': [
+            {
+                'step': 1,
+                'action': "Update IAM role policy",
+                'details': f"Add these permissions: {', '.join(missing_permissions)}"
+            },
+            *_INSUFFICIENT_PERMISSIONS_STATIC_STEPS
+        ]
+    }
+
+
+@lru_cache(maxsize=256)
+def _no_instances_remediation(region: str) -> Dict[str, Any]:
+    tmpl = _NO_INSTANCES_REMEDIATION
+    return {
+        **tmpl,
+        'description': tmpl['description'].format(region=region),
+        'required_actions': [
+            {
+                'step': 1,
+                'action': "Verify RDS instances exist",
+                'details': _NO_INSTANCES_VERIFY_DETAILS.format(region=region)
+            },
+            _NO_INSTANCES_FILTER_STEP
+        ]
+    }
+
+
 class ErrorCatalog:
     """
     Catalog of known errors with remediation steps.
@@ -74,31 +359,7 @@ class ErrorCatalog:
                 'role_name': role_name
             },
             severity="warning",
-            remediation={
-                'title': "Cross-Account Role Not Configured",
-                'description': f"The dashboard cannot discover RDS instances in account {account_id} because the cross-account IAM role is not set up.",
-                'impact': "RDS instances in this account will not be visible in the dashboard.",
-                'required_actions': [
-                    {
-                        'step': 1,
-                        'action': f"Create IAM role '{role_name}' in account {account_id}",
-                        'details': "This role allows the dashboard to read RDS instance information."
-                    },
-                    {
-                        'step': 2,
-                        'action': "Configure trust relationship",
-                        'details': f"Allow the dashboard Lambda role to assume this role with the configured external ID."
-                    },
-                    {
-                        'step': 3,
-                        'action': "Attach required permissions",
-                        'details': "Grant rds:Describe*, cloudwatch:GetMetricStatistics, and tag:GetResources permissions."
-                    }
-                ],
-                'documentation_link': "/docs/cross-account-setup.md",
-                'can_skip': True,
-                'skip_reason': "Discovery will continue in other configured accounts and regions."
-            }
+            remediation_factory=lambda: _cross_account_remediation(account_id, role_name)
         )
     
     @staticmethod
@@ -112,25 +373,7 @@ class ErrorCatalog:
                 'region': region
             },
             severity="info",
-            remediation={
-                'title': "AWS Region Not Enabled",
-                'description': f"Region {region} is not enabled in account {account_id}. This is normal if you don't use this region.",
-                'impact': "No RDS instances will be discovered in this region.",
-                'required_actions': [
-                    {
-                        'step': 1,
-                        'action': "Enable the region (optional)",
-                        'details': f"Go to AWS Console → Account Settings → Enable {region}"
-                    },
-                    {
-                        'step': 2,
-                        'action': "Or remove from configuration",
-                        'details': f"Update TARGET_REGIONS environment variable to exclude {region}"
-                    }
-                ],
-                'can_skip': True,
-                'skip_reason': "Discovery will continue in other enabled regions."
-            }
+            remediation_factory=lambda: _region_not_enabled_remediation(account_id, region)
         )
     
     @staticmethod
@@ -145,31 +388,7 @@ class ErrorCatalog:
                 'missing_permissions': missing_permissions
             },
             severity="error",
-            remediation={
-                'title': "Insufficient IAM Permissions",
-                'description': "The dashboard Lambda role does not have all required permissions.",
-                'impact': "Cannot discover or monitor RDS instances properly.",
-                'required_actions': [
-                    {
-                        'step': 1,
-                        'action': "Update IAM role policy",
-                        'details': f"Add these permissions: {', '.join(missing_permissions)}"
-                    },
-                    {
-                        'step': 2,
-                        'action': "Verify policy attachment",
-                        'details': "Ensure the policy is attached to the Lambda execution role."
-                    },
-                    {
-                        'step': 3,
-                        'action': "Wait for propagation",
-                        'details': "IAM changes may take up to 60 seconds to propagate."
-                    }
-                ],
-                'documentation_link': "/docs/iam-permissions.md",
-                'can_skip': False,
-                'skip_reason': None
-            }
+            remediation_factory=lambda: _insufficient_permissions_remediation(tuple(missing_permissions))
         )
     
     @staticmethod
@@ -183,25 +402,7 @@ class ErrorCatalog:
                 'region': region
             },
             severity="info",
-            remediation={
-                'title': "No RDS Instances Discovered",
-                'description': f"No RDS instances were found in {region}. This is normal if you don't have RDS instances in this region.",
-                'impact': "No impact - this is informational only.",
-                'required_actions': [
-                    {
-                        'step': 1,
-                        'action': "Verify RDS instances exist",
-                        'details': f"Check AWS Console → RDS → {region} to confirm instances exist."
-                    },
-                    {
-                        'step': 2,
-                        'action': "Check filters (if applicable)",
-                        'details': "Ensure no tag-based filters are excluding your instances."
-                    }
-                ],
-                'can_skip': True,
-                'skip_reason': "This is informational - no action needed if you don't use RDS in this region."
-            }
+            remediation_factory=lambda: _no_instances_remediation(region)
         )
     
     @staticmethod
@@ -215,33 +416,25 @@ class ErrorCatalog:
             error_message=error_message,
             context=context,
             severity="error",
-            remediation={
+            remediation_factory=lambda: {
+                **_GENERIC_REMEDIATION,
                 'title': f"Unexpected Error: {error_type}",
-                'description': error_message,
-                'impact': "Discovery may be incomplete for this account/region.",
-                'required_actions': [
-                    {
-                        'step': 1,
-                        'action': "Check CloudWatch Logs",
-                        'details': "Review Lambda logs for detailed error information."
-                    },
-                    {
-                        'step': 2,
-                        'action': "Verify AWS service status",
-                        'details': "Check https://status.aws.amazon.com/ for service issues."
-                    },
-                    {
-                        'step': 3,
-                        'action': "Retry discovery",
-                        'details': "Manually trigger discovery again or wait for next scheduled run."
-                    }
-                ],
-                'can_skip': True,
-                'skip_reason': "Discovery will continue in other accounts/regions."
+                'description': error_message
             }
         )
 
 
+# Keywords that identify the AWS error categories in an error message. Each
+# alternative is a lookahead, so keywords that overlap in the message are
+# all found rather than the first one hiding the rest.
+_CATEGORY_RE = re.compile(
+    r'(?=(?P<access>AccessDenied|not authorized))'
+    r'|(?=(?P<assume>AssumeRole))'
+    r'|(?=(?P<optin>OptInRequired|not subscribed))'
+    r'|(?=(?P<throttle>Throttling|Rate exceeded))'
+)
+
+
 def categorize_aws_error(error: Exception, context: Dict[str, Any]) -> ActionableError:
     """
     Categorize AWS errors and provide actionable remediation.
@@ -253,15 +446,18 @@ def categorize_aws_error(error: Exception, context: Dict[str, Any]) -> Actionabl
     Returns:
         ActionableError with remediation steps
     """
-    error_message = str(error)
-    error_type = type(error).__name__
+    # One scan collects every category keyword in the message; categories
+    # are then checked in priority order
+    categories = {match.lastgroup for match in _CATEGORY_RE.finditer(str(error))}
+    if not categories:
+        return ErrorCatalog.generic_error(error, context)
     
     account_id = context.get('account_id', 'unknown')
     region = context.get('region', 'unknown')
     
     # AccessDenied errors
-    if 'AccessDenied' in error_message or 'not authorized' in error_message:
-        if 'AssumeRole' in error_message:
+    if 'access' in categories:
+        if 'assume' in categories:
             role_name = context.get('role_name', 'RDSDashboardCrossAccountRole')
             return ErrorCatalog.cross_account_access_denied(account_id, region, role_name)
         else:
@@ -270,35 +466,17 @@ def categorize_aws_error(error: Exception, context: Dict[str, Any]) -> Actionabl
             return ErrorCatalog.insufficient_permissions(account_id, region, missing_perms)
     
     # Region not enabled
-    if 'OptInRequired' in error_message or 'not subscribed' in error_message:
+    if 'optin' in categories:
         return ErrorCatalog.region_not_enabled(account_id, region)
     
     # Throttling
-    if 'Throttling' in error_message or 'Rate exceeded' in error_message:
+    if 'throttle' in categories:
         return ActionableError(
             error_type="ThrottlingException",
             error_message=f"AWS API rate limit exceeded in {region}",
             context=context,
             severity="warning",
-            remediation={
-                'title': "AWS API Rate Limit Exceeded",
-                'description': "Too many API calls to AWS services. This is temporary.",
-                'impact': "Discovery may be delayed but will retry automatically.",
-                'required_actions': [
-                    {
-                        'step': 1,
-                        'action': "Wait and retry",
-                        'details': "AWS will automatically allow requests after the rate limit window passes."
-                    },
-                    {
-                        'step': 2,
-                        'action': "Consider request throttling",
-                        'details': "If this happens frequently, contact AWS support to increase limits."
-                    }
-                ],
-                'can_skip': True,
-                'skip_reason': "Discovery will retry automatically on next scheduled run."
-            }
+            remediation=_THROTTLING_REMEDIATION
         )
     
     # Generic error
@@ -324,6 +502,38 @@ ERROR_STATUS_CODES = {
     'Timeout': 504,
 }
 
+# Status codes for stdlib exception classes; subclasses inherit them
+_STATUS_BY_CLASS = {
+    ValueError: 400,
+    KeyError: 400,
+    TypeError: 400,
+    TimeoutError: 504,
+}
+
+# Exception class -> status code resolved from its class hierarchy (None when
+# only the message can tell), so each class is resolved once per container
+_status_by_type: Dict[type, Optional[int]] = {}
+
+# All status keywords in one case-folded alternation, so an error message is
+# scanned once instead of once per keyword. Group kN is the Nth keyword. The
+# groups sit in zero-width lookaheads so overlapping keywords all match, as
+# they did with one substring check per keyword.
+_STATUS_KEYWORDS = tuple(ERROR_STATUS_CODES.items())
+_STATUS_KEYWORD_RE = re.compile('|'.join(
+    f'(?=(?P<k{i}>{re.escape(keyword.lower())}))'
+    for i, (keyword, _) in enumerate(_STATUS_KEYWORDS)
+))
+
+
+def _status_for_class(error_class: type) -> Optional[int]:
+    """Status code for the nearest class in the hierarchy that has one."""
+    for klass in error_class.__mro__:
+        if klass in _STATUS_BY_CLASS:
+            return _STATUS_BY_CLASS[klass]
+        if klass.__name__ in ERROR_STATUS_CODES:
+            return ERROR_STATUS_CODES[klass.__name__]
+    return None
+
 
 def get_status_code(error: Exception) -> int:
     """
@@ -335,22 +545,112 @@ def get_status_code(error: Exception) -> int:
     Returns:
         HTTP status code
     """
-    error_type = type(error).__name__
-    error_message = str(error)
+    error_class = type(error)
     
     # Check error type
-    if error_type in ERROR_STATUS_CODES:
-        return ERROR_STATUS_CODES[error_type]
+    try:
+        status_code = _status_by_type[error_class]
+    except KeyError:
+        status_code = _status_by_type[error_class] = _status_for_class(error_class)
+    if status_code is not None:
+        return status_code
     
-    # Check error message for keywords
-    for keyword, status_code in ERROR_STATUS_CODES.items():
-        if keyword.lower() in error_message.lower():
-            return status_code
+    # Check the AWS error code of botocore ClientErrors
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        aws_code = response.get('Error', {}).get('Code')
+        if aws_code in ERROR_STATUS_CODES:
+            return ERROR_STATUS_CODES[aws_code]
+    
+    # Check error message for keywords; when several keywords occur, the one
+    # listed first in ERROR_STATUS_CODES wins
+    first = None
+    for match in _STATUS_KEYWORD_RE.finditer(str(error).lower()):
+        index = int(match.lastgroup[1:])
+        if first is None or index < first:
+            first = index
+            if first == 0:
+                break
+    if first is not None:
+        return _STATUS_KEYWORDS[first][1]
     
     # Default to 500
     return 500
 
 
+_LOG_MESSAGE_PREFIX = 'Lambda handler error: '
+
+
+def _extract_correlation_id(event: Dict[str, Any]) -> str:
+    """
+    Correlation ID from the X-Correlation-ID header, else the API Gateway
+    request ID, else 'unknown'.
+    
+    HTTP APIs lowercase header names, so that spelling is checked first.
+    Missing or null headers/requestContext, and non-dict events, are tolerated.
+    """
+    if not isinstance(event, dict):
+        return 'unknown'
+    headers = event.get('headers')
+    if headers:
+        correlation_id = headers.get('x-correlation-id') or headers.get('X-Correlation-ID')
+        if correlation_id:
+            return correlation_id
+    request_context = event.get('requestContext')
+    if request_context:
+        return request_context.get('requestId') or 'unknown'
+    return 'unknown'
+
+
+def _write_log(record: Dict[str, Any], raw_fields: Optional[Dict[str, str]] = None) -> None:
+    """
+    Write a structured log record to stdout as a single JSON line.
+    
+    With orjson the encoded bytes go straight to the binary stdout buffer in
+    one write; otherwise (or when stdout has been replaced by a text-only
+    stream) the line is printed.
+    
+    Args:
+        record: Non-empty log record
+        raw_fields: Extra fields whose values are already serialized JSON;
+            they are appended to the record without being encoded again
+    """
+    suffix = ''.join(f',"{key}":{value}' for key, value in raw_fields.items()) if raw_fields else ''
+    stream = sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    if orjson and buffer is not None:
+        data = orjson.dumps(record, default=str)
+        if suffix:
+            data = data[:-1] + suffix.encode() + b'}'
+        # Flush pending text first so earlier print() output stays in order
+        stream.flush()
+        buffer.write(data + b'\n')
+        buffer.flush()
+    else:
+        line = _dumps(record)
+        if suffix:
+            line = line[:-1] + suffix + '}'
+        print(line)
+
+
+def _format_traceback(error: BaseException) -> str:
+    """
+    Format the innermost TRACEBACK_LIMIT frames of an exception's traceback.
+    
+    Only file, line number and function are written for each frame; source
+    lines are not read, which keeps linecache (and its disk reads and stat
+    calls) off the error path.
+    """
+    frames = deque(traceback.walk_tb(error.__traceback__), maxlen=TRACEBACK_LIMIT)
+    lines = ['Traceback (most recent call last):\n']
+    lines.extend(
+        f'  File "{frame.f_code.co_filename}", line {lineno}, in {frame.f_code.co_name}\n'
+        for frame, lineno in frames
+    )
+    lines.extend(traceback.format_exception_only(type(error), error))
+    return ''.join(lines)
+
+
 def handle_lambda_error(func: Callable) -> Callable:
     """
     Decorator for Lambda handlers to provide consistent error handling.
@@ -359,7 +659,8 @@ def handle_lambda_error(func: Callable) -> Callable:
     - Catches all exceptions
     - Maps to appropriate HTTP status codes
     - Includes correlation IDs in error responses
-    - Logs errors with full context
+    - Logs errors with full context (tracebacks for 5xx errors, or for all
+      errors when TRACE_ALL_ERRORS=true)
     - Returns properly formatted error responses
     
     Usage:
@@ -370,34 +671,33 @@ def handle_lambda_error(func: Callable) -> Callable:
     """
     @wraps(func)
     def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-        correlation_id = None
+        # Extract correlation ID if present; this never raises, so it stays
+        # outside the protected call
+        correlation_id = _extract_correlation_id(event)
         
         try:
-            # Extract correlation ID if present
-            correlation_id = event.get('headers', {}).get('X-Correlation-ID')
-            if not correlation_id:
-                correlation_id = event.get('requestContext', {}).get('requestId', 'unknown')
-            
             # Call the actual handler
             return func(event, context)
             
         except Exception as e:
             # Get status code
             status_code = get_status_code(e)
+            server_error = status_code >= 500
+            error_type = type(e).__name__
+            error_message = str(e)
             
             # Build error context
             error_context = {
                 'function_name': getattr(context, 'function_name', 'unknown'),
                 'request_id': getattr(context, 'aws_request_id', 'unknown'),
                 'correlation_id': correlation_id,
-                'error_type': type(e).__name__,
-                'error_message': str(e),
-                'traceback': traceback.format_exc()
+                'error_type': error_type,
+                'error_message': error_message
             }
             
             # Try to categorize AWS errors
             actionable_error = None
-            if 'boto' in str(type(e).__module__).lower() or 'botocore' in str(type(e).__module__).lower():
+            if _AWS_ERROR_BASES and isinstance(e, _AWS_ERROR_BASES):
                 try:
                     actionable_error = categorize_aws_error(e, error_context)
                 except:
@@ -405,33 +705,41 @@ def handle_lambda_error(func: Callable) -> Callable:
             
             # Build error response
             error_response = {
-                'error': type(e).__name__,
-                'message': str(e),
+                'error': error_type,
+                'message': error_message,
                 'correlation_id': correlation_id,
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': _utc_timestamp()
             }
             
             # Add actionable error details if available
             if actionable_error:
-                error_response['actionable_error'] = actionable_error.to_dict()
+                error_response['actionable_error'] = actionable_error.to_dict(
+                    include_remediation=server_error or INCLUDE_REMEDIATION
+                )
+            
+            # Serialize the response once; the log line embeds the same text
+            body = _dumps(error_response)
             
-            # Log the error (will be picked up by structured logger if configured)
-            print(json.dumps({
+            # Log the error (will be picked up by structured logger if configured).
+            # The traceback only goes to the log, never into the response.
+            _write_log({
                 'level': 'ERROR',
-                'message': f'Lambda handler error: {type(e).__name__}',
+                'message': _LOG_MESSAGE_PREFIX + error_type,
                 'correlation_id': correlation_id,
-                'error': error_response,
-                'context': error_context
-            }))
+                'context': {
+                    **error_context,
+                    'traceback': _format_traceback(e) if server_error or TRACE_ALL_ERRORS else None
+                }
+            }, raw_fields={'error': body})
             
             # Return error response
             return {
                 'statusCode': status_code,
                 'headers': {
                     'Content-Type': 'application/json',
-                    'X-Correlation-ID': correlation_id or 'unknown'
+                    'X-Correlation-ID': correlation_id
                 },
-                'body': json.dumps(error_response)
+                'body': body
             }
     
     return wrapper
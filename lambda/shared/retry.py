@@ -24,8 +24,41 @@ from typing import Callable, Type, Tuple, Optional
 from functools import wraps
 import logging
 
+try:
+    from botocore.exceptions import (
+        ClientError,
+        ConnectionClosedError,
+        ConnectionError as BotocoreConnectionError,
+        ReadTimeoutError,
+    )
+except ImportError:
+    ClientError = None
+
 logger = logging.getLogger(__name__)
 
+# AWS SDK errors worth retrying: connection failures and timeouts always,
+# ClientError only for throttling and server-side failures. botocore's
+# ConnectionError covers endpoint, connect-timeout and proxy failures.
+if ClientError is not None:
+    _AWS_RETRYABLE = (BotocoreConnectionError, ReadTimeoutError, ConnectionClosedError)
+    _AWS_RETRY_EXCEPTIONS = (ClientError,) + _AWS_RETRYABLE
+else:
+    _AWS_RETRYABLE = ()
+    _AWS_RETRY_EXCEPTIONS = (Exception,)
+
+_RETRYABLE_AWS_ERROR_CODES = frozenset({
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'SlowDown',
+    'ServiceUnavailable',
+    'InternalError',
+})
+
 
 class RetryExhausted(Exception):
     """Raised when all retry attempts have been exhausted."""
@@ -39,7 +72,8 @@ def retry(
     exponential_base: float = 2.0,
     jitter: bool = True,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    retry_if: Optional[Callable[[Exception], bool]] = None
 ):
     """
     Decorator that retries a function with exponential backoff.
@@ -52,6 +86,8 @@ def retry(
         jitter: Whether to add random jitter to prevent thundering herd
         exceptions: Tuple of exception types to retry on
         on_retry: Optional callback function called on each retry
+        retry_if: Optional predicate; a caught exception for which it returns
+            False is re-raised immediately instead of being retried
     
     Returns:
         Decorated function
@@ -62,6 +98,12 @@ def retry(
             # Your code here
             pass
     """
+    # Backoff delay before each retry, fixed by the arguments above
+    delays = tuple(
+        min(base_delay * (exponential_base ** i), max_delay)
+        for i in range(max_attempts - 1)
+    )
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -74,40 +116,46 @@ def retry(
                     return func(*args, **kwargs)
                     
                 except exceptions as e:
+                    if retry_if is not None and not retry_if(e):
+                        raise
+                    
                     attempt += 1
                     last_exception = e
                     
                     # If we've exhausted all attempts, raise
                     if attempt >= max_attempts:
-                        logger.error(
-                            f"Retry exhausted for {func.__name__} after {max_attempts} attempts",
-                            extra={
-                                'function': func.__name__,
-                                'attempts': attempt,
-                                'error': str(e)
-                            }
-                        )
+                        if logger.isEnabledFor(logging.ERROR):
+                            logger.error(
+                                f"Retry exhausted for {func.__name__} after {max_attempts} attempts",
+                                extra={
+                                    'function': func.__name__,
+                                    'attempts': attempt,
+                                    'error': str(e)
+                                }
+                            )
                         raise RetryExhausted(
                             f"Failed after {max_attempts} attempts. Last error: {str(e)}"
                         ) from e
                     
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base ** (attempt - 1)), max_delay)
+                    # Look up delay with exponential backoff
+                    delay = delays[attempt - 1]
                     
-                    # Add jitter if enabled (random value between 0 and delay)
+                    # Add jitter if enabled (random value between half the delay and the delay)
                     if jitter:
-                        delay = delay * (0.5 + random.random() * 0.5)
+                        delay = random.uniform(delay * 0.5, delay)
                     
-                    logger.warning(
-                        f"Retry attempt {attempt}/{max_attempts} for {func.__name__} after {delay:.2f}s",
-                        extra={
-                            'function': func.__name__,
-                            'attempt': attempt,
-                            'max_attempts': max_attempts,
-                            'delay': delay,
-                            'error': str(e)
-                        }
-                    )
+                    # Skip building the message and extra fields when they would be dropped
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            f"Retry attempt {attempt}/{max_attempts} for {func.__name__} after {delay:.2f}s",
+                            extra={
+                                'function': func.__name__,
+                                'attempt': attempt,
+                                'max_attempts': max_attempts,
+                                'delay': delay,
+                                'error': str(e)
+                            }
+                        )
                     
                     # Call retry callback if provided
                     if on_retry:
@@ -161,6 +209,26 @@ def retry_with_backoff(
     return decorated()
 
 
+def is_retryable_aws_error(error: Exception) -> bool:
+    """
+    Check whether an AWS SDK error is transient.
+    
+    Connection errors and timeouts are retryable; a ClientError is retryable
+    only for throttling codes or a 5xx response. Anything else (bad
+    parameters, missing resources, programming errors) fails fast.
+    """
+    if ClientError is None:
+        return True
+    if isinstance(error, _AWS_RETRYABLE):
+        return True
+    if isinstance(error, ClientError):
+        response = error.response
+        if response.get('Error', {}).get('Code') in _RETRYABLE_AWS_ERROR_CODES:
+            return True
+        return response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500
+    return False
+
+
 # Common retry configurations for different scenarios
 
 def retry_aws_api(func: Callable) -> Callable:
@@ -174,7 +242,8 @@ def retry_aws_api(func: Callable) -> Callable:
         max_delay=30.0,
         exponential_base=2.0,
         jitter=True,
-        exceptions=(Exception,)  # AWS SDK exceptions
+        exceptions=_AWS_RETRY_EXCEPTIONS,
+        retry_if=is_retryable_aws_error
     )(func)
 
 
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Tests for the Approval Workflow Lambda
+
+Tests conditional approvals, auto-approved batches, event publishing and the
+approval event subscribers. DynamoDB calls go through a real boto3 resource whose client is
+stubbed with botocore's Stubber, so the requests that would be sent are checked. The stubber sees request parameters before the resource
+marshals them, so expected parameters use plain Python values.
+
+Requirements: REQ-APPROVAL (Operations Approval Workflow)
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.stub import Stubber, ANY
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+APPROVAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'approval-workflow')
+
+
+def _load_module(name, filename):
+    """Load a module from the approval-workflow directory."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(APPROVAL_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+approval_handler = _load_module('approval_handler', 'handler.py')
+event_subscribers = _load_module('approval_event_subscribers', 'event_subscribers.py')
+
+_serializer = TypeSerializer()
+
+
+def _typed(item):
+    """Serialize a Python dict into a DynamoDB typed item."""
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def _conditional_check_failed(stubber, method):
+    """Queue a ConditionalCheckFailedException for method."""
+    stubber.add_client_error(
+        method,
+        service_error_code='ConditionalCheckFailedException',
+        service_message='The conditional request failed',
+        http_status_code=400
+    )
+
+
+@pytest.fixture
+def dynamodb():
+    """Real DynamoDB resource; its client is stubbed by each test."""
+    return boto3.resource(
+        'dynamodb',
+        region_name='ap-southeast-1',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing'
+    )
+
+
+@pytest.fixture
+def service(dynamodb, monkeypatch):
+    """Approval service using the stubbable resource and a mock SNS client."""
+    monkeypatch.setenv('APPROVALS_TABLE', 'test-approvals')
+    monkeypatch.setenv('AUDIT_LOG_TABLE', 'test-audit')
+    monkeypatch.setenv('APPROVAL_EVENTS_TOPIC_ARN', 'arn:aws:sns:ap-southeast-1:123456789012:approval-events')
+    with patch.object(approval_handler.AWSClients, 'get_dynamodb_resource', return_value=dynamodb), \
+         patch.object(approval_handler.AWSClients, 'get_sns_client', return_value=MagicMock()):
+        return approval_handler.ApprovalWorkflowService()
+
+
+@pytest.fixture
+def stubber(service):
+    """Stubber on the client behind the service's DynamoDB resource."""
+    with Stubber(service.dynamodb.meta.client) as stub:
+        yield stub
+        stub.assert_no_pending_responses()
+
+
+def _pending_request(**overrides):
+    """A pending high-risk request awaiting a second approval."""
+    request = {
+        'request_id': 'req-1',
+        'operation_type': 'modify_instance_class',
+        'instance_id': 'prod-postgres-01',
+        'requested_by': 'requester@example.com',
+        'risk_level': 'high',
+        'status': 'pending',
+        'approvals_required': 2,
+        'approvals_received': 1,
+        'approved_by': ['first@example.com'],
+        'comments': []
+    }
+    request.update(overrides)
+    return request
+
+
+def _approval_update(stubber, attributes):
+    """Queue the conditional approval update returning attributes."""
+    stubber.add_response(
+        'update_item',
+        {'Attributes': _typed(attributes)},
+        {
+            'TableName': 'test-approvals',
+            'Key': {'request_id': 'req-1'},
+            'UpdateExpression': ANY,
+            'ConditionExpression': 'attribute_exists(request_id) AND #status = :pending '
+                                   'AND NOT contains(approved_by, :user) '
+                                   'AND requested_by <> :user',
+            'ExpressionAttributeNames': {'#status': 'status'},
+            'ExpressionAttributeValues': ANY,
+            'ReturnValues': 'ALL_NEW'
+        }
+    )
+
+
+def _get_request(stubber, item):
+    """Queue a get_item returning item."""
+    stubber.add_response('get_item', {'Item': _typed(item)})
+
+
+class TestApproveRequest:
+    """Test conditional approvals."""
+    
+    def test_final_approval_transitions_to_approved(self, service, stubber):
+        """Test the approval that completes the count flips the status."""
+        recorded = _pending_request(
+            approvals_received=2,
+            approved_by=['first@example.com', 'second@example.com']
+        )
+        _approval_update(stubber, recorded)
+        stubber.add_response('update_item', {'Attributes': _typed(dict(recorded, status='approved'))})
+        
+        request = service.approve_request('req-1', 'second@example.com')
+        
+        assert request['status'] == 'approved'
+        published = json.loads(service.sns.publish.call_args.kwargs['Message'])
+        assert published['event_type'] == 'APPROVAL_GRANTED'
+        assert published['request']['status'] == 'approved'
+    
+    def test_concurrent_final_approval_returns_success(self, service, stubber):
+        """Test losing the race to flip the status still returns the approved request."""
+        recorded = _pending_request(
+            approvals_received=3,
+            approved_by=['first@example.com', 'other@example.com', 'second@example.com']
+        )
+        _approval_update(stubber, recorded)
+        _conditional_check_failed(stubber, 'update_item')
+        stubber.add_response(
+            'get_item',
+            {'Item': _typed(dict(recorded, status='approved'))},
+            {'TableName': 'test-approvals', 'Key': {'request_id': 'req-1'}, 'ConsistentRead': True}
+        )
+        
+        request = service.approve_request('req-1', 'second@example.com')
+        
+        assert request['status'] == 'approved'
+        assert 'second@example.com' in request['approved_by']
+        # The approver that made the transition already announced it
+        published = json.loads(service.sns.publish.call_args.kwargs['Message'])
+        assert published['details']['status'] == 'approved'
+        assert published['request']['status'] == 'pending'
+    
+    def test_already_approved_by_user(self, service, stubber):
+        """Test a second approval from the same user is rejected."""
+        _conditional_check_failed(stubber, 'update_item')
+        _get_request(stubber, _pending_request())
+        
+        with pytest.raises(ValueError, match='already approved by first@example.com'):
+            service.approve_request('req-1', 'first@example.com')
+    
+    def test_cannot_approve_own_request(self, service, stubber):
+        """Test the requester cannot approve their own request."""
+        _conditional_check_failed(stubber, 'update_item')
+        _get_request(stubber, _pending_request())
+        
+        with pytest.raises(ValueError, match='Cannot approve your own request'):
+            service.approve_request('req-1', 'requester@example.com')
+    
+    def test_cannot_approve_request_not_pending(self, service, stubber):
+        """Test a rejected request cannot be approved."""
+        _conditional_check_failed(stubber, 'update_item')
+        _get_request(stubber, _pending_request(status='rejected'))
+        
+        with pytest.raises(ValueError, match='Cannot approve request with status rejected'):
+            service.approve_request('req-1', 'second@example.com')
+    
+    def test_approve_missing_request(self, service, stubber):
+        """Test approving an unknown request reports it as not found."""
+        _conditional_check_failed(stubber, 'update_item')
+        stubber.add_response('get_item', {})
+        
+        with pytest.raises(ValueError, match='not found'):
+            service.approve_request('req-1', 'second@example.com')
+
+
+class TestPublishEvent:
+    """Test approval event publishing and its audit fallback."""
+    
+    def test_event_published_to_topic(self, service):
+        """Test events go to the topic with the request snapshot and no direct audit write."""
+        with patch.object(service.audit_table, 'put_item') as put_item:
+            service._publish_event('APPROVAL_REJECTED', 'first@example.com', 'req-1',
+                                   {'reason': 'Too risky'}, _pending_request())
+        
+        put_item.assert_not_called()
+        publish = service.sns.publish.call_args.kwargs
+        assert publish['MessageAttributes']['event_type']['StringValue'] == 'APPROVAL_REJECTED'
+        assert json.loads(publish['Message'])['request']['request_id'] == 'req-1'
+    
+    def test_audit_written_directly_without_topic(self, service, stubber):
+        """Test the audit entry is written directly when no topic is configured."""
+        service.events_topic_arn = None
+        stubber.add_response('put_item', {}, {'TableName': 'test-audit', 'Item': ANY})
+        
+        service._publish_event('APPROVAL_REJECTED', 'first@example.com', 'req-1',
+                               {'reason': 'Too risky'}, _pending_request())
+        
+        service.sns.publish.assert_not_called()
+    
+    def test_audit_written_directly_when_publish_fails(self, service):
+        """Test the audit entry, without the request snapshot, is written when publishing fails."""
+        service.sns.publish.side_effect = Exception('SNS unavailable')
+        with patch.object(service.audit_table, 'put_item') as put_item:
+            service._publish_event('APPROVAL_REJECTED', 'first@example.com', 'req-1',
+                                   {'reason': 'Too risky'}, _pending_request())
+        
+        item = put_item.call_args.kwargs['Item']
+        assert item['event_type'] == 'APPROVAL_REJECTED'
+        assert item['details'] == {'reason': 'Too risky'}
+        assert 'request' not in item
+
+
+def _unprocessed():
+    """A fresh UnprocessedItems response; the resource unmarshals responses in place."""
+    return {'test-audit': [{'PutRequest': {'Item': {'event_id': {'S': 'e-1'}}}}]}
+
+
+def _batch_entry(index):
+    """Keyword arguments for one auto-approved request."""
+    return {
+        'operation_type': 'create_snapshot',
+        'instance_id': f'dev-postgres-{index:02d}',
+        'parameters': {},
+        'requested_by': 'requester@example.com',
+        'risk_level': 'low',
+        'environment': 'non-production',
+        'justification': 'Routine snapshot'
+    }
+
+
+class TestAutoApprovedBatch:
+    """Test auto-approved batch creation."""
+    
+    def test_batch_written_in_chunks_of_25(self, service, stubber):
+        """Test 15 requests and their audit entries go out as 25 + 5 writes."""
+        stubber.add_response('batch_write_item', {})
+        stubber.add_response('batch_write_item', {})
+        
+        with patch.object(service.dynamodb.meta.client, 'batch_write_item',
+                          wraps=service.dynamodb.meta.client.batch_write_item) as batch_write:
+            requests = service.create_auto_approved_batch([_batch_entry(i) for i in range(15)])
+        
+        assert len(requests) == 15
+        sizes = [
+            sum(len(items) for items in call.kwargs['RequestItems'].values())
+            for call in batch_write.call_args_list
+        ]
+        assert sizes == [25, 5]
+    
+    def test_unprocessed_items_are_retried(self, service, stubber):
+        """Test UnprocessedItems are resubmitted until written."""
+        stubber.add_response('batch_write_item', {'UnprocessedItems': _unprocessed()})
+        stubber.add_response(
+            'batch_write_item',
+            {'UnprocessedItems': {}},
+            {'RequestItems': {'test-audit': [{'PutRequest': {'Item': {'event_id': 'e-1'}}}]}}
+        )
+        
+        with patch.object(approval_handler.time, 'sleep') as sleep:
+            service.create_auto_approved_batch([_batch_entry(0)])
+        
+        sleep.assert_called_once_with(service.BATCH_WRITE_BASE_DELAY)
+    
+    def test_entry_with_missing_field_is_rejected(self, service, stubber):
+        """Test an entry missing a required field is named in the error."""
+        entry = _batch_entry(1)
+        del entry['justification']
+        
+        with pytest.raises(ValueError, match=r'requests\[1\] is missing required fields: justification'):
+            service.create_auto_approved_batch([_batch_entry(0), entry])
+    
+    def test_entry_with_unknown_field_is_rejected(self, service, stubber):
+        """Test an entry with an unknown field is named in the error."""
+        entry = dict(_batch_entry(0), priority='high')
+        
+        with pytest.raises(ValueError, match=r'requests\[0\] has unknown fields: priority'):
+            service.create_auto_approved_batch([entry])
+    
+    def test_invalid_entry_returns_400(self, service):
+        """Test the handler reports an invalid entry as a bad request."""
+        event = {'body': json.dumps({
+            'operation': 'create_auto_approved_batch',
+            'requests': [{'instance_id': 'dev-postgres-01'}]
+        })}
+        with patch.object(approval_handler, 'get_approval_service', return_value=service):
+            response = approval_handler.lambda_handler(event, MagicMock())
+        
+        assert response['statusCode'] == 400
+        assert 'requests[0] is missing required fields' in json.loads(response['body'])['error']
+    
+    def test_unprocessed_items_exhaust_retries(self, service, stubber):
+        """Test RetryExhausted is raised when items stay unprocessed."""
+        for _ in range(service.BATCH_WRITE_MAX_RETRIES + 1):
+            stubber.add_response('batch_write_item', {'UnprocessedItems': _unprocessed()})
+        
+        with patch.object(approval_handler.time, 'sleep'), \
+             pytest.raises(approval_handler.RetryExhausted):
+            service.create_auto_approved_batch([_batch_entry(0)])
+
+
+class TestBuildApprovalRequest:
+    """Test new approval request items."""
+    
+    @pytest.mark.parametrize('estimated_cost, expected', [
+        (12.5, Decimal('12.5')),
+        (1e10, Decimal('10000000000')),
+        (123456789012.5, Decimal('123456789012.5')),
+        (40, Decimal('40')),
+    ])
+    def test_estimated_cost_kept_as_submitted(self, service, estimated_cost, expected):
+        """Test large costs are accepted and costs are not rounded."""
+        request = service._build_approval_request(
+            datetime.now(timezone.utc), estimated_cost=estimated_cost, **_batch_entry(0)
+        )
+        
+        assert request['estimated_cost'] == expected
+    
+    def test_estimated_cost_not_rounded_to_cents(self, service):
+        """Test sub-cent costs keep their float value."""
+        request = service._build_approval_request(
+            datetime.now(timezone.utc), estimated_cost=12.345, **_batch_entry(0)
+        )
+        
+        assert float(request['estimated_cost']) == 12.345
+    
+    def test_missing_estimated_cost(self, service):
+        """Test no cost is stored as None."""
+        request = service._build_approval_request(datetime.now(timezone.utc), **_batch_entry(0))
+        
+        assert request['estimated_cost'] is None
+
+
+class TestEventSubscribers:
+    """Test the approval event subscribers."""
+    
+    @staticmethod
+    def _sns_event(*approval_events):
+        """Wrap approval events in an SNS-triggered Lambda event."""
+        return {'Records': [
+            {'Sns': {'Message': json.dumps(approval_event)}} for approval_event in approval_events
+        ]}
+    
+    def test_audit_writer_stores_event_without_request(self, monkeypatch):
+        """Test audit entries are written without the request snapshot, floats as Decimal."""
+        audit_table = MagicMock()
+        monkeypatch.setattr(event_subscribers, '_audit_table', audit_table)
+        approval_event = {
+            'event_id': 'e-1',
+            'timestamp': '2025-12-01T00:00:00',
+            'event_type': 'APPROVAL_REQUEST_CREATED',
+            'user': 'requester@example.com',
+            'request_id': 'req-1',
+            'details': {'estimated_cost': 12.5},
+            'request': _pending_request()
+        }
+        
+        result = event_subscribers.audit_writer_handler(self._sns_event(approval_event), None)
+        
+        assert result == {'written': 1}
+        item = audit_table.put_item.call_args.kwargs['Item']
+        assert 'request' not in item
+        assert item['event_id'] == 'e-1'
+        assert item['details']['estimated_cost'] == event_subscribers.Decimal('12.5')
+    
+    def test_audit_writer_keeps_published_numbers(self, service, monkeypatch):
+        """Test Decimals in a published event reach the audit table as numbers."""
+        audit_table = MagicMock()
+        monkeypatch.setattr(event_subscribers, '_audit_table', audit_table)
+        request = _pending_request(estimated_cost=Decimal('12.345'))
+        service._publish_event('APPROVAL_REQUEST_CREATED', 'requester@example.com', 'req-1',
+                               request, request)
+        message = service.sns.publish.call_args.kwargs['Message']
+        
+        event_subscribers.audit_writer_handler({'Records': [{'Sns': {'Message': message}}]}, None)
+        
+        details = TypeSerializer().serialize(
+            audit_table.put_item.call_args.kwargs['Item']['details']
+        )['M']
+        assert details['estimated_cost'] == {'N': '12.345'}
+        assert details['approvals_required'] == {'N': '2'}
+    
+    def test_notifier_skips_unhandled_events(self, monkeypatch):
+        """Test only events that need a notification are sent."""
+        sns = MagicMock()
+        monkeypatch.setattr(event_subscribers, '_sns_client', sns)
+        monkeypatch.setenv('SNS_TOPIC_ARN', 'arn:aws:sns:ap-southeast-1:123456789012:dashboard')
+        pending_grant = {
+            'event_type': 'APPROVAL_GRANTED', 'user': 'first@example.com',
+            'details': {}, 'request': _pending_request()
+        }
+        cancelled = {
+            'event_type': 'APPROVAL_CANCELLED', 'user': 'requester@example.com',
+            'details': {}, 'request': _pending_request(status='cancelled')
+        }
+        approved = {
+            'event_type': 'APPROVAL_GRANTED', 'user': 'second@example.com',
+            'details': {}, 'request': _pending_request(
+                status='approved', approved_by=['first@example.com', 'second@example.com']
+            )
+        }
+        
+        result = event_subscribers.notification_handler(
+            self._sns_event(pending_grant, cancelled, approved), None
+        )
+        
+        assert result == {'sent': 1}
+        assert sns.publish.call_args.kwargs['Subject'] == 'RDS Operation Approved: modify_instance_class'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
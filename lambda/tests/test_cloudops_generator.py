@@ -8,8 +8,12 @@ Requirements: REQ-5.3, REQ-5.4, REQ-5.5
 
 import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
+import boto3
+from boto3.dynamodb.types import TypeSerializer
+from botocore.stub import Stubber
 import sys
 import os
 
@@ -85,13 +89,42 @@ def generator(mock_config):
     """Create generator instance with mocked dependencies."""
     with patch('cloudops_generator.handler.Config.load', return_value=mock_config), \
          patch('cloudops_generator.handler.AWSClients.get_dynamodb_resource'), \
+         patch('cloudops_generator.handler.AWSClients.get_dynamodb_client'), \
          patch('cloudops_generator.handler.AWSClients.get_s3_client'), \
-         patch('cloudops_generator.handler.get_logger'):
+         patch('cloudops_generator.handler.get_logger'), \
+         patch('cloudops_generator.handler.logger', MagicMock()):
         
         gen = CloudOpsRequestGenerator()
         gen.dynamodb = MagicMock()
+        gen.dynamodb_client = MagicMock()
         gen.s3 = MagicMock()
-        return gen
+        yield gen
+
+
+def make_dynamodb_client():
+    """Create a real low-level DynamoDB client for use with Stubber."""
+    return boto3.client(
+        'dynamodb',
+        region_name='ap-southeast-1',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing'
+    )
+
+
+def add_get_item_response(stubber, table_name, item, attributes):
+    """Expect a projected get_item for test-postgres-01 and answer with the projected item."""
+    names = {f'#a{i}': attribute for i, attribute in enumerate(attributes)}
+    serializer = TypeSerializer()
+    stubber.add_response(
+        'get_item',
+        {'Item': {k: serializer.serialize(v) for k, v in item.items() if k in attributes}},
+        {
+            'TableName': table_name,
+            'Key': {'instance_id': {'S': 'test-postgres-01'}},
+            'ProjectionExpression': ', '.join(names),
+            'ExpressionAttributeNames': names
+        }
+    )
 
 
 class TestRequestValidation:
@@ -232,10 +265,12 @@ class TestRequestGeneration:
             'peak_cpu': '95'
         }
         
-        result = generator._generate_request(
+        result, request_id = generator._generate_request(
             mock_instance, 'scaling', changes, mock_compliance, template
         )
         
+        assert request_id.startswith('test-postgres-01-scaling-')
+        assert request_id in result
         assert 'test-postgres-01' in result
         assert 'db.r6g.xlarge' in result
         assert 'Need more capacity' in result
@@ -261,7 +296,7 @@ class TestRequestGeneration:
             'preferred_time': '02:00'
         }
         
-        result = generator._generate_request(
+        result, request_id = generator._generate_request(
             mock_instance, 'parameter_change', changes, mock_compliance, template
         )
         
@@ -283,7 +318,7 @@ class TestRequestGeneration:
             'new_maintenance_window': 'mon:02:00-mon:03:00'
         }
         
-        result = generator._generate_request(
+        result, request_id = generator._generate_request(
             mock_instance, 'maintenance', changes, mock_compliance, template
         )
         
@@ -331,22 +366,22 @@ class TestStorageAndAudit:
         
         generator.s3.put_object = Mock()
         
-        request_id = generator._save_request(
-            'test-instance', 'scaling', content_md, content_txt
+        generator._save_request(
+            'test-instance', 'scaling', 'test-instance-scaling-20251120-020000',
+            content_md, content_txt
         )
         
-        assert request_id.startswith('test-instance-scaling-')
         assert generator.s3.put_object.call_count == 2
         
+        # Uploads run concurrently, so match calls by key rather than order
+        calls = {c[1]['Key'].rsplit('.', 1)[1]: c[1] for c in generator.s3.put_object.call_args_list}
+        
         # Check Markdown save
-        md_call = generator.s3.put_object.call_args_list[0]
-        assert md_call[1]['Key'].endswith('.md')
-        assert md_call[1]['ContentType'] == 'text/markdown'
+        assert calls['md']['Key'].endswith('test-instance-scaling-20251120-020000.md')
+        assert calls['md']['ContentType'] == 'text/markdown'
         
         # Check plain text save
-        txt_call = generator.s3.put_object.call_args_list[1]
-        assert txt_call[1]['Key'].endswith('.txt')
-        assert txt_call[1]['ContentType'] == 'text/plain'
+        assert calls['txt']['ContentType'] == 'text/plain'
     
     def test_audit_logging(self, generator):
         """Test audit trail logging with full details."""
@@ -380,15 +415,41 @@ class TestStorageAndAudit:
         assert item['success'] is True
 
 
+class TestItemReads:
+    """Test projected reads through the low-level DynamoDB client."""
+    
+    def test_get_instance_sends_projection(self, generator, mock_instance):
+        """Test get_item sends a typed key and projection, and the item is deserialized."""
+        from cloudops_generator.handler import _INSTANCE_ATTRIBUTES
+        
+        client = make_dynamodb_client()
+        generator.dynamodb_client = client
+        with Stubber(client) as stubber:
+            add_get_item_response(stubber, 'test_rds_inventory', mock_instance, _INSTANCE_ATTRIBUTES)
+            instance = generator._get_instance('test-postgres-01')
+            stubber.assert_no_pending_responses()
+        
+        assert instance == mock_instance
+    
+    def test_get_compliance_missing_item(self, generator):
+        """Test a missing compliance item reads as empty."""
+        client = make_dynamodb_client()
+        generator.dynamodb_client = client
+        with Stubber(client) as stubber:
+            stubber.add_response('get_item', {})
+            assert generator._get_compliance('test-postgres-01') == {}
+
+
 class TestEndToEnd:
     """Test end-to-end request handling."""
     
     @patch('cloudops_generator.handler.get_logger')
     @patch('cloudops_generator.handler.Config.load')
     @patch('cloudops_generator.handler.AWSClients.get_dynamodb_resource')
+    @patch('cloudops_generator.handler.AWSClients.get_dynamodb_client')
     @patch('cloudops_generator.handler.AWSClients.get_s3_client')
     def test_successful_scaling_request(
-        self, mock_s3, mock_dynamo, mock_config, mock_logger,
+        self, mock_s3, mock_dynamo_low_level, mock_dynamo, mock_config, mock_logger,
         mock_instance, mock_compliance
     ):
         """Test complete scaling request flow."""
@@ -404,27 +465,20 @@ class TestEndToEnd:
             )
         )
         
+        from cloudops_generator.handler import _INSTANCE_ATTRIBUTES, _COMPLIANCE_ATTRIBUTES
+        
         mock_dynamo_client = MagicMock()
         mock_dynamo.return_value = mock_dynamo_client
+        mock_dynamo_client.Table.return_value = Mock()
         
-        # Mock DynamoDB responses
-        mock_inventory_table = Mock()
-        mock_inventory_table.get_item.return_value = {'Item': mock_instance}
-        
-        mock_compliance_table = Mock()
-        mock_compliance_table.get_item.return_value = {'Item': mock_compliance}
-        
-        mock_audit_table = Mock()
-        
-        def table_selector(table_name):
-            if 'inventory' in table_name:
-                return mock_inventory_table
-            elif 'compliance' in table_name:
-                return mock_compliance_table
-            else:
-                return mock_audit_table
-        
-        mock_dynamo_client.Table.side_effect = table_selector
+        # Reads go through a real low-level client; the stubber checks the
+        # requests that would be sent
+        dynamodb_client = make_dynamodb_client()
+        mock_dynamo_low_level.return_value = dynamodb_client
+        stubber = Stubber(dynamodb_client)
+        for _ in range(2):
+            add_get_item_response(stubber, 'test_inventory', mock_instance, _INSTANCE_ATTRIBUTES)
+            add_get_item_response(stubber, 'rds_compliance', mock_compliance, _COMPLIANCE_ATTRIBUTES)
         
         # Mock S3
         mock_s3_client = MagicMock()
@@ -448,17 +502,31 @@ class TestEndToEnd:
             })
         }
         
-        # Execute
-        response = lambda_handler(event, Mock())
+        # Full content is returned only when requested
+        request = json.loads(event['body'])
+        request['include_content'] = True
+        
+        # Execute; a single worker keeps the instance and compliance reads in
+        # submission order for the stubber
+        with patch('cloudops_generator.handler._io_pool', ThreadPoolExecutor(max_workers=1)), stubber:
+            response = lambda_handler(event, Mock())
+            response_with_content = lambda_handler({'body': json.dumps(request)}, Mock())
+            stubber.assert_no_pending_responses()
         
         # Verify
         assert response['statusCode'] == 200
         body = json.loads(response['body'])
         assert 'request_id' in body
-        assert 'content_markdown' in body
-        assert 'content_plaintext' in body
+        assert body['preview'] == '# Template\ntest-postgres-01'
+        assert body['s3_location_markdown'].endswith(f"{body['request_id']}.md")
+        assert 'content_markdown' not in body
+        assert 'content_plaintext' not in body
         assert body['instance_id'] == 'test-postgres-01'
         assert body['request_type'] == 'scaling'
+        
+        body = json.loads(response_with_content['body'])
+        assert body['content_markdown'] == '# Template\ntest-postgres-01'
+        assert body['content_plaintext'] == 'Template\ntest-postgres-01'
 
 
 if __name__ == '__main__':
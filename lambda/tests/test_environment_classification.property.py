@@ -425,6 +425,44 @@ class TestEnvironmentClassification:
         # Should always be lowercase
         assert environment == environment_value.lower()
         assert environment.islower() or not environment.isalpha()  # Handle non-alphabetic characters
+    
+    @given(st.lists(st.one_of(environment_tags(), st.just({})), min_size=1, max_size=10))
+    @settings(max_examples=50, deadline=3000)
+    def test_batch_classification_matches_single(self, tag_sets):
+        """
+        Property 6i: Batch classification agrees with per-instance classification.
+        
+        For any list of instances, classify_many should return the same
+        environments and sources, in input order, as the singular methods.
+        """
+        config = {
+            'default_environment': 'non-production',
+            'environment_tag_names': ['Environment', 'Env', 'ENV', 'environment', 'env', 'Stage', 'STAGE'],
+            'naming_patterns': {
+                'production': ['^prod-'],
+                'development': ['^dev-']
+            },
+            'account_mappings': {
+                '123456789012': 'staging'
+            }
+        }
+        
+        classifier = EnvironmentClassifier(config)
+        
+        instances = [
+            {
+                'instance_id': ['prod-db', 'dev-db', 'other-db'][i % 3],
+                'account_id': ['123456789012', '999999999999'][i % 2],
+                'region': 'us-east-1',
+                'tags': tags
+            }
+            for i, tags in enumerate(tag_sets)
+        ]
+        
+        environments, sources = classifier.classify_many(instances)
+        
+        assert environments == [classifier.get_environment(instance) for instance in instances]
+        assert sources == [classifier.get_classification_source(instance) for instance in instances]
 
 
 if __name__ == '__main__':
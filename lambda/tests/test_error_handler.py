@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared error handler
+
+Tests the keyword scans behind get_status_code and categorize_aws_error,
+including messages where keywords overlap.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.error_handler import categorize_aws_error, get_status_code
+
+
+class MessageError(Exception):
+    """Exception whose status can only come from its message."""
+    pass
+
+
+class TestGetStatusCode:
+    """Test status codes resolved from the error message."""
+    
+    @pytest.mark.parametrize('message, expected', [
+        ('Resource NotFound', 404),
+        ('no keywords here', 500),
+        # The keyword listed first in ERROR_STATUS_CODES wins
+        ('Timeout after TooManyRequests', 429),
+        # The winning keyword shares characters with a lower-priority
+        # keyword that starts earlier in the message
+        ('...TimeouTooManyRequests', 429),
+        ('conflictypeerror', 400),
+        ('ErrorTimeoutypeErrorons', 400),
+    ])
+    def test_message_keywords(self, message, expected):
+        """The highest-priority keyword anywhere in the message sets the status."""
+        assert get_status_code(MessageError(message)) == expected
+
+
+class TestCategorizeAwsError:
+    """Test AWS error categories found in the message."""
+    
+    def test_assume_role_access_denied(self):
+        """AccessDenied together with AssumeRole is a cross-account failure."""
+        error = MessageError('AccessDenied when calling AssumeRole')
+        
+        result = categorize_aws_error(error, {'account_id': '123456789012'})
+        
+        assert result.error_type == 'CrossAccountAccessDenied'
+    
+    def test_no_category(self):
+        """A message with no category keyword falls back to the generic error."""
+        result = categorize_aws_error(MessageError('boom'), {})
+        
+        assert result.error_type == 'MessageError'
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared retry helpers
+
+Tests that retry_aws_api fails fast on non-transient errors and backs off on
+throttling and connection failures. time.sleep is patched, so a retry shows
+up as a recorded sleep rather than a real delay.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import (
+    ClientError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ProxyConnectionError,
+    ReadTimeoutError,
+)
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared import retry as retry_module
+from shared.retry import is_retryable_aws_error, retry_aws_api, RetryExhausted
+
+
+def client_error(code, status=400):
+    """Build a ClientError with the given error code and HTTP status."""
+    return ClientError(
+        {'Error': {'Code': code, 'Message': code},
+         'ResponseMetadata': {'HTTPStatusCode': status}},
+        'TestOperation'
+    )
+
+
+@pytest.fixture
+def sleep():
+    """Patch the sleep used between attempts."""
+    with patch.object(retry_module.time, 'sleep') as mock_sleep:
+        yield mock_sleep
+
+
+class TestRetryAwsApi:
+    """Test which errors retry_aws_api retries."""
+    
+    @pytest.mark.parametrize('error', [
+        KeyError('instance_id'),
+        client_error('ValidationException'),
+        client_error('ResourceNotFoundException'),
+    ])
+    def test_non_retryable_error_raised_without_sleeping(self, sleep, error):
+        """Programming errors and client-side ClientErrors fail on the first attempt."""
+        func = MagicMock(side_effect=error, __name__='func')
+        
+        with pytest.raises(type(error)) as exc_info:
+            retry_aws_api(func)()
+        
+        assert exc_info.value is error
+        assert func.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_throttling_retried_until_success(self, sleep):
+        """A throttled call is retried and its eventual result returned."""
+        func = MagicMock(
+            side_effect=[client_error('ThrottlingException'), {'ok': True}],
+            __name__='func'
+        )
+        
+        assert retry_aws_api(func)() == {'ok': True}
+        assert func.call_count == 2
+        assert sleep.call_count == 1
+    
+    def test_server_error_retried_until_exhausted(self, sleep):
+        """A persistent 5xx ClientError uses every attempt then raises RetryExhausted."""
+        func = MagicMock(side_effect=client_error('InternalFailure', 500), __name__='func')
+        
+        with pytest.raises(RetryExhausted):
+            retry_aws_api(func)()
+        
+        assert func.call_count == 5
+        assert sleep.call_count == 4
+    
+    @pytest.mark.parametrize('error', [
+        EndpointConnectionError(endpoint_url='https://rds.amazonaws.com'),
+        ConnectTimeoutError(endpoint_url='https://rds.amazonaws.com'),
+        ProxyConnectionError(proxy_url='https://proxy.internal'),
+        ReadTimeoutError(endpoint_url='https://rds.amazonaws.com'),
+    ])
+    def test_connection_errors_retried(self, sleep, error):
+        """Every botocore connection failure and read timeout is retried."""
+        assert is_retryable_aws_error(error)
+        func = MagicMock(side_effect=[error, 'done'], __name__='func')
+        
+        assert retry_aws_api(func)() == 'done'
+        assert func.call_count == 2
+        assert sleep.call_count == 1